@@ -0,0 +1,546 @@
+import os
+import time
+import tkinter as tk
+from collections import OrderedDict
+from functools import partial
+
+# Optional Pillow support for JPEG and other formats not supported by
+# Tk's PhotoImage (which commonly supports GIF/PNG).
+try:
+    from PIL import Image, ImageTk
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+import asset_bundle
+import frame_cache
+import image_budget
+import profiler
+import resampling
+
+
+class FrameClock:
+    """Real-time playback position for a sequence of frames.
+
+    Each frame is held for its own duration (from the GIF metadata when
+    available) and deadlines are measured with ``time.monotonic()``. When
+    the Tk loop runs late, frames whose slot has already passed are
+    skipped rather than queued, so playback never drifts behind.
+    """
+
+    MIN_DELAY = 20
+
+    def __init__(self, next_index, duration, default_delay=100, max_skip=256):
+        self.next_index = next_index
+        self.duration = duration
+        self.default_delay = default_delay
+        self.max_skip = max_skip
+        self.index = 0
+        self.skipped = 0
+        self._deadline = None
+
+    @classmethod
+    def for_sequence(cls, durations, default_delay=100):
+        count = len(durations)
+        return cls(lambda i: (i + 1) % count, durations.__getitem__, default_delay)
+
+    def _seconds(self, index):
+        try:
+            ms = self.duration(index)
+        except Exception:
+            ms = None
+        # Like browsers, treat a missing or zero duration as the default delay
+        if not ms:
+            ms = self.default_delay
+        return max(ms, self.MIN_DELAY) / 1000.0
+
+    def start(self, index=0):
+        self.index = index
+        self._deadline = time.monotonic() + self._seconds(index)
+        return self.delay_ms()
+
+    def delay_ms(self):
+        """Milliseconds until the current frame should be replaced"""
+        if self._deadline is None:
+            return self.default_delay
+        return max(1, int(round((self._deadline - time.monotonic()) * 1000)))
+
+    def tick(self):
+        """Advance to the frame that should be on screen now and return its index"""
+        now = time.monotonic()
+        if self._deadline is None:
+            self.start(self.index)
+            return self.index
+
+        index = self.next_index(self.index)
+        deadline = self._deadline + self._seconds(index)
+        skipped = 0
+        while deadline <= now:
+            if skipped >= self.max_skip:
+                # Far behind (e.g. the loop was blocked); resync instead of catching up
+                deadline = now + self._seconds(index)
+                break
+            index = self.next_index(index)
+            deadline += self._seconds(index)
+            skipped += 1
+
+        self.skipped += skipped
+        self.index = index
+        self._deadline = deadline
+        return index
+
+
+class SpriteSheet:
+    """All frames of one animation packed into a single PhotoImage.
+
+    Showing a frame copies its region of the sheet into one display image,
+    so only two Tk images exist however many frames the animation has.
+    """
+
+    MAX_SHEET_WIDTH = 4096
+
+    def __init__(self, frame_size, frame_count):
+        self.frame_w, self.frame_h = frame_size
+        self.frame_count = frame_count
+        self.columns = max(1, min(frame_count, self.MAX_SHEET_WIDTH // max(1, self.frame_w)))
+        self.rows = -(-frame_count // self.columns)
+        self.sheet = tk.PhotoImage(width=self.frame_w * self.columns, height=self.frame_h * self.rows)
+        self.display = tk.PhotoImage(width=self.frame_w, height=self.frame_h)
+        self._filled = set()
+
+    def _origin(self, index):
+        return (index % self.columns) * self.frame_w, (index // self.columns) * self.frame_h
+
+    def has(self, index):
+        return index in self._filled
+
+    def put(self, index, photo):
+        x, y = self._origin(index)
+        self.sheet.tk.call(self.sheet, "copy", photo, "-to", x, y)
+        self._filled.add(index)
+
+    def show(self, index):
+        x, y = self._origin(index)
+        self.display.tk.call(self.display, "copy", self.sheet,
+                             "-from", x, y, x + self.frame_w, y + self.frame_h,
+                             "-to", 0, 0, "-compositingrule", "set")
+        return self.display
+
+    def pixel_bytes(self):
+        return (self.columns * self.rows + 1) * self.frame_w * self.frame_h * 4
+
+
+class VisibilityGate:
+    """Tracks whether a widget can currently be seen.
+
+    Withdrawing or iconifying a window only unmaps the toplevel, so Map and
+    Unmap are watched on both the widget and its toplevel. On X11 a
+    ``<Visibility>`` event also reports windows that are fully covered.
+    ``on_show``/``on_hide`` are called on every transition.
+    """
+
+    def __init__(self, widget, on_show, on_hide=None):
+        self.widget = widget
+        self.on_show = on_show
+        self.on_hide = on_hide
+        self._obscured = False
+        self._bindings = []
+        toplevel = widget.winfo_toplevel()
+        for target in {widget, toplevel}:
+            for sequence in ("<Map>", "<Unmap>"):
+                funcid = target.bind(sequence, self._update, add="+")
+                self._bindings.append((target, sequence, funcid))
+        funcid = widget.bind("<Visibility>", self._on_visibility, add="+")
+        self._bindings.append((widget, "<Visibility>", funcid))
+        self.visible = self.is_visible()
+
+    def is_visible(self):
+        try:
+            return bool(self.widget.winfo_viewable()) and not self._obscured
+        except tk.TclError:
+            return False
+
+    def _on_visibility(self, event):
+        self._obscured = event.state == "VisibilityFullyObscured"
+        self._update()
+
+    def _update(self, event=None):
+        visible = self.is_visible()
+        if visible == self.visible:
+            return
+        self.visible = visible
+        callback = self.on_show if visible else self.on_hide
+        if callback is not None:
+            callback()
+
+    def release(self):
+        for target, sequence, funcid in self._bindings:
+            profiler.unbind(target, sequence, funcid)
+        self._bindings = []
+
+
+class AnimationLoop:
+    """Calls ``step`` on the Tk loop for as long as ``widget`` is visible.
+
+    ``step`` returns the delay in ms until it should run again, or None to
+    stop. While the widget is unmapped, withdrawn, iconified or covered
+    nothing is scheduled at all; when it is shown again ``on_resume`` (if
+    given) returns the delay for the first step, e.g. after restarting a
+    :class:`FrameClock` so the hidden time is not treated as lateness.
+    """
+
+    def __init__(self, widget, step, on_resume=None):
+        self.widget = widget
+        self.step = step
+        self.on_resume = on_resume
+        self.running = False
+        self._after_id = None
+        self.gate = VisibilityGate(widget, self._on_show, self._on_hide)
+
+    def start(self, delay=0):
+        self.running = True
+        self._schedule(delay)
+
+    def _schedule(self, delay):
+        self._cancel()
+        if self.running and self.gate.visible:
+            self._after_id = self.widget.after(max(0, int(delay)), self._run)
+
+    def _cancel(self):
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _run(self):
+        self._after_id = None
+        if not self.running or not self.gate.visible:
+            return
+        try:
+            if not self.widget.winfo_exists():
+                self.running = False
+                return
+        except tk.TclError:
+            self.running = False
+            return
+        delay = self.step()
+        if delay is None:
+            self.running = False
+            return
+        self._schedule(delay)
+
+    def _on_hide(self):
+        self._cancel()
+
+    def _on_show(self):
+        if self.running and self._after_id is None:
+            delay = self.on_resume() if self.on_resume is not None else 0
+            self._schedule(delay or 0)
+
+    def stop(self):
+        self.running = False
+        self._cancel()
+
+    def destroy(self):
+        self.stop()
+        self.gate.release()
+
+
+class FrameSource:
+    """Decodes the frames of an image file on demand.
+
+    Frame N is only decoded, converted and resized the first time it is
+    asked for. Decoded frames are kept in a small LRU cache; pass
+    ``max_frames`` to cap how many stay resident (``None`` keeps all).
+    Resized frames are also persisted through :mod:`frame_cache`, so a
+    later launch loads them as ready-made PNGs. With ``sprite_sheet=True``
+    decoded frames are packed into a :class:`SpriteSheet` instead of being
+    kept as one PhotoImage each. Resident frames are accounted for in
+    :mod:`image_budget`, which may ask the source to drop them; they are
+    simply decoded again when next needed. Given a
+    :class:`resampling.Refiner`, frames are first shown as fast drafts and
+    upgraded to LANCZOS quality in the background.
+    """
+
+    def __init__(self, path, target_size=None, max_frames=None, crop=None, sprite_sheet=False,
+                 owner="FrameSource", refiner=None):
+        path = asset_bundle.resolve_image(path, target_size, crop)
+        self.path = path
+        self.target_size = target_size
+        self.crop = crop
+        self.max_frames = max_frames
+        self.sprite_sheet = sprite_sheet
+        self.refiner = refiner if target_size is not None else None
+        self.frame_count = None
+        self._pil = None
+        self._src_size = None
+        self._reopen = None
+        self._shown = None
+        self._disk = None
+        self._writer = None
+        self._sheet = None
+        self._cache = OrderedDict()
+        self._durations = {}
+        self.memory = image_budget.register(owner, path, evict=self.clear)
+
+        if target_size is not None:
+            self._disk = frame_cache.lookup(path, target_size, crop)
+        if self._disk is not None:
+            self.frame_count = self._disk.frame_count
+            self._durations = dict(enumerate(self._disk.durations))
+            return
+
+        if HAS_PIL:
+            try:
+                self._pil, self._src_size = resampling.open_image(path, target_size, crop,
+                                                                  draft=self.refiner is not None)
+                # A reduced JPEG decode has to be redone at full size for the LANCZOS pass
+                self._reopen = path if self._pil.size != self._src_size else None
+                self.frame_count = getattr(self._pil, "n_frames", 1)
+                if target_size is not None:
+                    self._writer = frame_cache.FrameCacheWriter(path, target_size, crop, self.frame_count)
+            except Exception:
+                self._pil = None
+
+    def is_animated(self):
+        # Without Pillow the frame count is only known once we hit the end,
+        # so assume the file may be animated until proven otherwise.
+        return self.frame_count is None or self.frame_count > 1
+
+    def next_index(self, index):
+        if self.frame_count is None:
+            # Tk fallback: the end of the GIF is only found by trying to load past it
+            self.get(index + 1)
+        if self.frame_count:
+            return (index + 1) % self.frame_count
+        return index + 1
+
+    def duration(self, index):
+        """Display time of frame ``index`` in ms, or None when the file has no timing"""
+        if index in self._durations:
+            return self._durations[index]
+        ms = None
+        if self._pil is not None:
+            try:
+                self._pil.seek(index)
+                ms = self._pil.info.get("duration")
+            except Exception:
+                ms = None
+        self._durations[index] = ms
+        return ms
+
+    def get(self, index):
+        if self._sheet is not None and self._sheet.has(index):
+            self.memory.touch()
+            self._shown = index
+            return self._sheet.show(index)
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            self.memory.touch()
+            return self._cache[index]
+        if self.frame_count is not None and index >= self.frame_count:
+            return None
+
+        with profiler.span(f"decode {os.path.basename(self.path)}", "asset", frame=index):
+            frame = self._decode(index)
+        if frame is None:
+            # Tk fallback ran out of frames; remember where the GIF ends.
+            if self.frame_count is None:
+                self.frame_count = max(index, 1)
+            return None
+
+        # The sheet is sized up front, so it needs a known frame count
+        if self.sprite_sheet and self.frame_count:
+            if self._sheet is None:
+                self._sheet = SpriteSheet((frame.width(), frame.height()), self.frame_count)
+            self._sheet.put(index, frame)
+            self._account()
+            self._shown = index
+            return self._sheet.show(index)
+
+        self._cache[index] = frame
+        if self.max_frames is not None:
+            while len(self._cache) > max(1, self.max_frames):
+                self._cache.popitem(last=False)
+        self._account()
+        return frame
+
+    def _account(self):
+        frames = len(self._cache) + (len(self._sheet._filled) if self._sheet is not None else 0)
+        self.memory.update(self.pixel_bytes(), frames)
+
+    def _decode(self, index):
+        if self._disk is not None:
+            frame = self._disk.load(index)
+            if frame is not None:
+                return frame
+            # Entry went missing or is damaged; decode the source instead
+            self._disk = None
+            if HAS_PIL:
+                try:
+                    self._pil = Image.open(self.path)
+                    self._src_size = self._pil.size
+                except Exception:
+                    self._pil = None
+
+        if self._pil is not None:
+            try:
+                self._pil.seek(index)
+                duration = self._pil.info.get("duration")
+                self._durations[index] = duration
+                raw = self._pil.copy()
+                if self.refiner is not None:
+                    draft = resampling.prepare_frame(raw, self.target_size, self.crop,
+                                                     resampling.DRAFT_FILTER, self._src_size)
+                    photo = ImageTk.PhotoImage(draft)
+                    job = resampling.refine_job(raw, self.target_size, self.crop, self._reopen)
+                    self.refiner.submit(job, partial(self._apply_refined, index, photo, duration))
+                    return photo
+                frame = resampling.prepare_frame(raw, self.target_size, self.crop)
+                if self._writer is not None:
+                    self._writer.add(index, frame, duration)
+                return ImageTk.PhotoImage(frame)
+            except EOFError:
+                return None
+            except Exception:
+                if index > 0:
+                    return None
+                self._pil = None
+
+        try:
+            return tk.PhotoImage(file=self.path, format=f"gif -index {index}")
+        except tk.TclError:
+            pass
+        if index == 0:
+            try:
+                self.frame_count = 1
+                return tk.PhotoImage(file=self.path)
+            except tk.TclError:
+                self.frame_count = 0
+        return None
+
+    def _apply_refined(self, index, photo, duration, frame):
+        if self._writer is not None:
+            self._writer.add(index, frame, duration)
+        if self._sheet is not None:
+            if self._sheet.has(index):
+                self._sheet.put(index, ImageTk.PhotoImage(frame))
+                if self._shown == index:
+                    self._sheet.show(index)
+            return
+        # Pasting in place updates every widget currently showing the draft
+        photo.paste(frame)
+
+    def tk_image_count(self):
+        if self._sheet is not None:
+            return 2 + len(self._cache)
+        return len(self._cache)
+
+    def pixel_bytes(self):
+        total = sum(f.width() * f.height() * 4 for f in self._cache.values())
+        if self._sheet is not None:
+            total += self._sheet.pixel_bytes()
+        return total
+
+    def clear(self):
+        self._cache.clear()
+        self._sheet = None
+        self.memory.update(0, 0)
+
+    def close(self):
+        if self.refiner is not None:
+            self.refiner.cancel()
+        self.clear()
+        self.memory.release()
+
+
+class AnimatedGIF(tk.Label):
+    def __init__(self, master, path, delay=100, bg="black", target_size=None, max_frames=None, crop=None,
+                 sprite_sheet=False, two_tier=True):
+        super().__init__(master, bg=bg)
+        self.master = master
+        self.delay = delay
+        self.target_size = target_size
+        self.index = 0
+        self.source = None
+        self.clock = None
+        self.loop = None
+        self._current_image = None
+
+        if not path:
+            return
+
+        refiner = resampling.Refiner(self) if two_tier else None
+        self.source = FrameSource(path, target_size=target_size, max_frames=max_frames, crop=crop,
+                                  sprite_sheet=sprite_sheet, owner="AnimatedGIF", refiner=refiner)
+        first = self.source.get(0)
+        if first is None:
+            return
+
+        # Keep a strong reference to the current image to prevent GC
+        self._current_image = first
+        self.configure(image=first)
+        if self.source.is_animated():
+            self.clock = FrameClock(self.source.next_index, self.source.duration, default_delay=delay)
+            self.loop = AnimationLoop(self, self.animate, on_resume=lambda: self.clock.start(self.index))
+            self.loop.start(self.clock.start(0))
+
+    def animate(self):
+        """Show the frame that is due now and return the delay until the next one"""
+        if self.source is None or self.clock is None:
+            return None
+        index = self.clock.tick()
+        frame = self.source.get(index)
+        if frame is None:
+            index = self.clock.index = 0
+            frame = self.source.get(0)
+        if frame is None or not self.source.is_animated():
+            return None
+        self.index = index
+        # With a sprite sheet the display image is updated in place
+        if frame is not self._current_image:
+            self._current_image = frame
+            self.configure(image=frame)
+        return self.clock.delay_ms()
+
+    def destroy(self):
+        if self.loop is not None:
+            self.loop.destroy()
+            self.loop = None
+        if self.source is not None:
+            self.source.close()
+        super().destroy()
+
+
+def compare_frame_storage(master, path, target_size=None, switches=200):
+    """Measure one-PhotoImage-per-frame against sprite-sheet storage for ``path``.
+
+    Returns Tk image count, pixel bytes held by Tk and the mean cost of a
+    frame switch (including the label redraw) for each mode.
+    """
+    results = {}
+    for sprite_sheet in (False, True):
+        source = FrameSource(path, target_size=target_size, sprite_sheet=sprite_sheet)
+        label = tk.Label(master)
+        label.pack()
+        count = source.frame_count or 1
+        for i in range(count):
+            source.get(i)
+
+        start = time.perf_counter()
+        for n in range(switches):
+            label.configure(image=source.get(n % count))
+            label.update_idletasks()
+        elapsed = time.perf_counter() - start
+
+        results["sprite_sheet" if sprite_sheet else "per_frame"] = {
+            "frames": count,
+            "tk_images": source.tk_image_count(),
+            "pixel_bytes": source.pixel_bytes(),
+            "switch_ms": elapsed * 1000 / switches,
+        }
+        label.destroy()
+        source.close()
+    return results
@@ -0,0 +1,207 @@
+"""Optimized asset bundle: offline builder and runtime lookup.
+
+``python asset_bundle.py`` reads the images and sound effects the visualizers
+use, pre-resizes every image to the exact size the code asks for (animated
+GIFs are also palette-quantized), transcodes the short sound effects and
+writes ``assets_bundle/manifest.json``. At runtime the loaders call
+:func:`resolve_image` / :func:`resolve_sound` first and fall back to the
+original files when there is no (up to date) bundled version.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import frame_cache
+import resampling
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BUNDLE_DIR = os.environ.get("VISUALIZER_BUNDLE") or os.path.join(HERE, "assets_bundle")
+MANIFEST_FILE = "manifest.json"
+BUNDLE_VERSION = 1
+
+# Short effects only; the long music tracks are streamed by the mixer anyway
+SOUND_SPECS = [
+    "push.mp3", "pop.mp3", "clear.mp3", "clear_popup.mp3", "invalid.mp3",
+    "pop_invalid.mp3", "peek_invalid.mp3", "push_invalid.mp3", "0623.mp3",
+    "Cha-Ching Sound Effect.mp3",
+    "Impact Laser - Free Sound Effect-[AudioTrimmer.com].mp3",
+]
+
+_manifest = None
+
+
+def _image_key(name, target_size, crop):
+    size = f"{target_size[0]}x{target_size[1]}" if target_size else "orig"
+    return f"{name}|{size}|{crop or 'resize'}"
+
+
+def manifest():
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(os.path.join(BUNDLE_DIR, MANIFEST_FILE), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            _manifest = data if data.get("version") == BUNDLE_VERSION else {}
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def _resolve(entry, path):
+    if not entry or not path:
+        return path
+    if frame_cache.source_hash(path) != entry.get("sha1"):
+        return path
+    bundled = os.path.join(BUNDLE_DIR, entry["file"])
+    return bundled if os.path.exists(bundled) else path
+
+
+def resolve_image(path, target_size=None, crop=None):
+    """Bundled, pre-resized copy of ``path`` for this size/crop, or ``path`` itself"""
+    if not path:
+        return path
+    key = _image_key(os.path.basename(path), target_size, crop)
+    return _resolve(manifest().get("images", {}).get(key), path)
+
+
+def resolve_sound(path):
+    """Bundled, transcoded copy of a sound effect, or ``path`` itself"""
+    if not path:
+        return path
+    return _resolve(manifest().get("sounds", {}).get(os.path.basename(path)), path)
+
+
+# --- builder ---------------------------------------------------------------
+
+def image_specs(screen_size=(1920, 1080)):
+    """(file, target_size, crop) for every bundled image, exactly as the loaders request it.
+
+    Built from the apps' own constants so the bundle follows them; files
+    that are not in the repo are left out.
+    """
+    from PIL import Image
+    import main
+    import recursion1clone
+    import tk_with_pics
+
+    specs = [
+        ("splash_image.png", main.HEADER_IMAGE_SIZE, None),
+        ("group67.png", main.CREDITS_IMAGE_SIZE, None),
+    ]
+    specs += [(os.path.basename(p), tk_with_pics.POPUP_MAX_SIZE, "fit") for p in tk_with_pics.popup_images()]
+    specs += [(name, recursion1clone.SLOT_SIZE, "center") for name in recursion1clone.SLOT_IMAGES]
+    specs += [(name, recursion1clone.RESULT_SIZE, "fit") for name in recursion1clone.RESULT_GIFS]
+    splash = os.path.join(HERE, main.SPLASH_GIF)
+    if os.path.exists(splash):
+        with Image.open(splash) as img:
+            specs.append((main.SPLASH_GIF, main.splash_layout(img.size, screen_size)[1], None))
+    return [spec for spec in specs if os.path.exists(os.path.join(HERE, spec[0]))]
+
+
+def _quantize(frame, colors):
+    method = getattr(getattr(resampling.Image, "Quantize", None), "FASTOCTREE", 2)
+    return frame.quantize(colors=colors, method=method)
+
+
+def build_image(name, target_size, crop, out_dir, colors=256):
+    from PIL import Image
+
+    src = os.path.join(HERE, name)
+    img = Image.open(src)
+    count = getattr(img, "n_frames", 1)
+    frames, durations = [], []
+    for i in range(count):
+        img.seek(i)
+        durations.append(img.info.get("duration") or 100)
+        frames.append(resampling.prepare_frame(img.copy(), target_size, crop))
+
+    base = os.path.splitext(name)[0]
+    size = f"{target_size[0]}x{target_size[1]}" if target_size else "orig"
+    if count > 1:
+        rel = os.path.join("images", f"{base}-{size}-{crop or 'resize'}.gif")
+        quantized = [_quantize(f, colors) for f in frames]
+        quantized[0].save(os.path.join(out_dir, rel), save_all=True, append_images=quantized[1:],
+                          duration=durations, loop=0, optimize=True, disposal=2)
+    else:
+        rel = os.path.join("images", f"{base}-{size}-{crop or 'resize'}.png")
+        frames[0].save(os.path.join(out_dir, rel), optimize=True)
+    return {"file": rel, "sha1": frame_cache.source_hash(src), "frames": count,
+            "size": list(frames[0].size)}
+
+
+def build_sound(name, out_dir, fmt="ogg"):
+    src = os.path.join(HERE, name)
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return None
+    rel = os.path.join("sounds", os.path.splitext(name)[0] + "." + fmt)
+    codec = ["-c:a", "libvorbis", "-q:a", "4"] if fmt == "ogg" else ["-c:a", "pcm_s16le"]
+    try:
+        subprocess.run([ffmpeg, "-y", "-loglevel", "error", "-i", src, *codec, os.path.join(out_dir, rel)],
+                       check=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"skip {name}: {e}")
+        return None
+    return {"file": rel, "sha1": frame_cache.source_hash(src)}
+
+
+def build(out_dir=BUNDLE_DIR, screen_size=(1920, 1080), sound_format="ogg", colors=256):
+    if not resampling.HAS_PIL:
+        raise RuntimeError("Pillow is required to build the asset bundle")
+    os.makedirs(os.path.join(out_dir, "images"), exist_ok=True)
+    os.makedirs(os.path.join(out_dir, "sounds"), exist_ok=True)
+
+    data = {"version": BUNDLE_VERSION, "images": {}, "sounds": {}}
+    for name, target_size, crop in image_specs(screen_size):
+        try:
+            entry = build_image(name, target_size, crop, out_dir, colors)
+        except Exception as e:
+            print(f"skip {name}: {e}")
+            continue
+        data["images"][_image_key(name, target_size, crop)] = entry
+        print(f"image {name} -> {entry['file']} ({entry['frames']} frame(s))")
+
+    if shutil.which("ffmpeg") is None:
+        print("ffmpeg not found: sound effects are not transcoded")
+    else:
+        for name in SOUND_SPECS:
+            if not os.path.exists(os.path.join(HERE, name)):
+                print(f"skip {name}: not found")
+                continue
+            entry = build_sound(name, out_dir, sound_format)
+            if entry is None:
+                continue
+            data["sounds"][name] = entry
+            print(f"sound {name} -> {entry['file']}")
+
+    with open(os.path.join(out_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+    return data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the optimized asset bundle.")
+    parser.add_argument("--out", default=BUNDLE_DIR, help="output directory (default: %(default)s)")
+    parser.add_argument("--screen", default="1920x1080",
+                        help="screen size the splash GIF is sized for (default: %(default)s)")
+    parser.add_argument("--wav", action="store_true", help="transcode sound effects to WAV instead of OGG")
+    parser.add_argument("--colors", type=int, default=256, help="palette size for animated GIFs")
+    args = parser.parse_args(argv)
+
+    try:
+        screen = tuple(int(v) for v in args.screen.lower().split("x"))
+    except ValueError:
+        parser.error("--screen must look like 1920x1080")
+    try:
+        build(args.out, screen, "wav" if args.wav else "ogg", args.colors)
+    except Exception as e:
+        print(f"Asset bundle build failed: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
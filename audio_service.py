@@ -0,0 +1,307 @@
+"""The one place that talks to ``pygame.mixer``.
+
+It initialises the mixer once, with one set of settings, for the menu and
+all three visualizers. It also runs a background music player and keeps a
+bank of decoded sound effects. ``python audio_service.py --bench`` measures
+what the shared mixer and the effect bank save when switching between
+visualizers.
+"""
+import importlib.util
+import io
+import os
+import queue
+import sys
+import threading
+import time
+
+import asset_bundle
+import profiler
+
+# pygame itself is only imported on first use, so importing this module
+# costs nothing at startup
+HAS_PYGAME = importlib.util.find_spec("pygame") is not None
+pygame = None
+
+# One configuration for every app
+MIXER_SETTINGS = {"frequency": 44100, "size": -16, "channels": 2, "buffer": 512}
+
+# Tracks are read into memory at most this size; larger files are handed to
+# the mixer by path (it streams them) but still opened off the Tk thread.
+PRELOAD_LIMIT = 16 * 1024 * 1024
+
+EFFECT_VOLUME = 0.2
+
+_STOP = object()
+_mixer_lock = threading.Lock()
+_mixer_ready = False
+_mixer_failed = False
+_effects = {}
+
+stats = {"mixer_inits": 0, "mixer_init_ms": 0.0, "effect_decodes": 0, "effect_hits": 0}
+
+
+def init_mixer():
+    """Initialise the mixer once for the whole process; returns True when usable.
+
+    Safe to call from any thread and as often as needed.
+    """
+    global pygame, _mixer_ready, _mixer_failed
+    if _mixer_ready:
+        return True
+    if _mixer_failed or not HAS_PYGAME:
+        return False
+    with _mixer_lock:
+        if _mixer_ready:
+            return True
+        try:
+            import pygame
+            if not pygame.mixer.get_init():
+                t0 = time.perf_counter()
+                with profiler.span("mixer init", "audio"):
+                    pygame.mixer.init(**MIXER_SETTINGS)
+                stats["mixer_inits"] += 1
+                stats["mixer_init_ms"] += (time.perf_counter() - t0) * 1000
+            _mixer_ready = True
+        except Exception as e:
+            print(f"Audio: could not initialise the mixer: {e}")
+            _mixer_failed = True
+    return _mixer_ready
+
+
+def resolve(track):
+    path = asset_bundle.resolve_sound(track)
+    if not os.path.isabs(path):
+        path = os.path.join(asset_bundle.HERE, path)
+    return path
+
+
+def load_effect(path, volume=EFFECT_VOLUME):
+    """Decoded ``pygame.mixer.Sound`` for ``path``, kept in the effect bank"""
+    if not init_mixer():
+        return None
+    path = resolve(path)
+    snd = _effects.get(path)
+    if snd is not None:
+        stats["effect_hits"] += 1
+        return snd
+    with profiler.span(f"decode {os.path.basename(path)}", "audio"):
+        snd = pygame.mixer.Sound(path)
+    snd.set_volume(volume)
+    _effects[path] = snd
+    stats["effect_decodes"] += 1
+    return snd
+
+
+def preload_effects(paths, volume=EFFECT_VOLUME):
+    """Decode sound effects into the bank; returns how many are ready"""
+    ready = 0
+    for path in paths:
+        try:
+            if load_effect(path, volume) is not None:
+                ready += 1
+        except Exception as e:
+            print(f"Audio: could not load {path}: {e}")
+    return ready
+
+
+def play_effect(path, loops=0, volume=EFFECT_VOLUME):
+    """Play a short sound on a free channel; returns False if it could not be played"""
+    try:
+        snd = load_effect(path, volume)
+        if snd is None:
+            return False
+        snd.play(loops=loops)
+        return True
+    except Exception:
+        return False
+
+
+class MusicService:
+    """Loads and plays ``pygame.mixer.music`` tracks on a worker thread.
+
+    ``play()``, ``stop()`` and ``preload()`` only queue a request and return
+    at once. Requests are handled in order, but a ``play()`` or ``stop()``
+    makes any older play still waiting in the queue obsolete, so rapid
+    window switches only start the last track asked for. Preloaded tracks
+    are kept as in-memory files and open without touching the disk again.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._data = {}
+        self.current = None
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="music", daemon=True)
+                self._thread.start()
+
+    def _submit(self, kind, *args, supersede=False):
+        if not HAS_PYGAME:
+            return
+        with self._lock:
+            if supersede:
+                self._generation += 1
+            generation = self._generation
+        self._ensure_worker()
+        self._queue.put((kind, generation, args))
+
+    def play(self, track, loops=0, volume=None):
+        """Start ``track`` as soon as it is loaded; returns immediately"""
+        self._submit("play", track, loops, volume, supersede=True)
+
+    def stop(self):
+        self._submit("stop", supersede=True)
+
+    def preload(self, *tracks):
+        """Read tracks into memory in the background so a later play() is instant"""
+        for track in tracks:
+            self._submit("preload", track)
+
+    def preload_now(self, *tracks):
+        """Like preload() but reads on the calling thread, e.g. inside a warm-up task"""
+        for track in tracks:
+            self._load_bytes(track)
+
+    def shutdown(self, timeout=1.0):
+        """Stop playback and wait for the worker"""
+        if self._thread is None:
+            return
+        self.stop()
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            kind, generation, args = item
+            try:
+                if kind == "preload":
+                    self._load_bytes(args[0])
+                elif generation == self._generation and init_mixer():
+                    if kind == "play":
+                        self._play(*args, generation=generation)
+                    else:
+                        pygame.mixer.music.stop()
+                        self.current = None
+            except Exception as e:
+                print(f"Music: {kind} failed: {e}")
+
+    def _load_bytes(self, track):
+        path = resolve(track)
+        if path in self._data:
+            return self._data[path]
+        try:
+            if os.path.getsize(path) > PRELOAD_LIMIT:
+                return None
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            print(f"Music: could not read {path}: {e}")
+            return None
+        self._data[path] = data
+        return data
+
+    def _play(self, track, loops, volume, generation):
+        path = resolve(track)
+        data = self._load_bytes(track)
+        if generation != self._generation:
+            return
+        if data is not None:
+            pygame.mixer.music.load(io.BytesIO(data), os.path.basename(path))
+        else:
+            pygame.mixer.music.load(path)
+        if generation != self._generation:
+            return
+        if volume is not None:
+            pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops=loops)
+        self.current = track
+
+
+service = MusicService()
+
+
+def play(track, loops=0, volume=None):
+    service.play(track, loops, volume)
+
+
+def stop():
+    service.stop()
+
+
+def preload(*tracks):
+    service.preload(*tracks)
+
+
+def preload_now(*tracks):
+    service.preload_now(*tracks)
+
+
+def shutdown(timeout=1.0):
+    """Stop the music worker and release the mixer"""
+    global _mixer_ready
+    service.shutdown(timeout)
+    with _mixer_lock:
+        if not _mixer_ready:
+            return
+        try:
+            pygame.mixer.music.stop()
+            pygame.mixer.music.unload()
+            _effects.clear()
+            pygame.mixer.quit()
+        except Exception as e:
+            print(f"Audio: error while shutting down: {e}")
+        _mixer_ready = False
+
+
+def benchmark(effects, rounds=6):
+    """Time a visualizer switch with per-app mixer setup against the shared service.
+
+    Per-app setup is what a switch used to cost: the mixer re-initialised
+    with the next app's settings and every effect decoded again. With the
+    shared service a switch only hits the initialised mixer and the bank.
+    """
+    if not init_mixer():
+        print("pygame mixer is not available")
+        return None
+    per_app, shared = [], []
+    for i in range(rounds):
+        settings = {"frequency": 33075} if i % 2 == 0 else MIXER_SETTINGS
+        t0 = time.perf_counter()
+        pygame.mixer.quit()
+        pygame.mixer.init(**settings)
+        for path in effects:
+            pygame.mixer.Sound(resolve(path))
+        per_app.append((time.perf_counter() - t0) * 1000)
+
+    pygame.mixer.quit()
+    pygame.mixer.init(**MIXER_SETTINGS)
+    _effects.clear()
+    preload_effects(effects)
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        init_mixer()
+        preload_effects(effects)
+        shared.append((time.perf_counter() - t0) * 1000)
+
+    result = {"effects": len(effects), "per_app_ms": sum(per_app) / rounds, "shared_ms": sum(shared) / rounds}
+    print(f"Switch with per-app mixer setup: {result['per_app_ms']:.1f} ms ({len(effects)} effects)")
+    print(f"Switch with the shared service:  {result['shared_ms']:.2f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        names = [n for n in sorted(os.listdir(asset_bundle.HERE))
+                 if n.endswith(".mp3") and os.path.getsize(os.path.join(asset_bundle.HERE, n)) < 200 * 1024]
+        benchmark(names)
+    else:
+        print("usage: python audio_service.py --bench")
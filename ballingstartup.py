@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-from itertools import count
 
 # Optional Pillow support for JPEG and other formats not supported by
 # Tk's PhotoImage (which commonly supports GIF/PNG). If Pillow is
@@ -11,91 +10,7 @@ try:
 except Exception:
     HAS_PIL = False
 
-# --- Animated GIF Loader ---
-class AnimatedGIF(tk.Label):
-    def __init__(self, master, path, delay=100, bg="black", target_size=None):
-        super().__init__(master, bg=bg)
-        self.master = master
-        self.delay = delay
-        self.frames = []
-        self.target_size = target_size
-        # Try to load frames using Pillow's ImageSequence for best
-        # compatibility. If that fails or Pillow not available, fall back
-        # to Tk's PhotoImage indexing.
-        if HAS_PIL:
-            try:
-                pil_img = Image.open(path)
-                from PIL import ImageSequence
-                for pil_frame in ImageSequence.Iterator(pil_img):
-                    try:
-                        # Ensure we have a concrete image in memory
-                        frame_copy = pil_frame.copy()
-                        # Convert to a mode ImageTk can handle (RGBA preferred)
-                        try:
-                            frame_conv = frame_copy.convert('RGBA')
-                        except Exception:
-                            frame_conv = frame_copy.convert('RGB')
-                        # If a target size is provided, resize while
-                        # preserving aspect ratio
-                        if self.target_size is not None:
-                            try:
-                                frame_conv = frame_conv.resize(self.target_size, Image.LANCZOS)
-                            except Exception:
-                                pass
-                        tk_frame = ImageTk.PhotoImage(frame_conv)
-                        self.frames.append(tk_frame)
-                    except Exception:
-                        # skip bad frames
-                        continue
-            except Exception:
-                # PIL failed to read the GIF; fall back below
-                self.frames = []
-
-        if not self.frames:
-            try:
-                # Load all frames of the GIF using PhotoImage indexing
-                for i in count(0):
-                    frame = tk.PhotoImage(file=path, format=f"gif -index {i}")
-                    self.frames.append(frame)
-            except tk.TclError:
-                pass  # no more frames
-
-        self.index = 0
-        # If no frames were loaded (bad path or unsupported GIF), try a
-        # single-frame load so the label still shows something instead of
-        # raising IndexError.
-        if not self.frames:
-            try:
-                img = tk.PhotoImage(file=path)
-                self.frames.append(img)
-            except tk.TclError:
-                # give up — keep an empty label
-                self.frames = []
-
-        if self.frames:
-            self.index = 0
-            # Keep a strong reference to the current image to prevent GC
-            self._current_image = self.frames[0]
-            self.configure(image=self._current_image)
-            # Debug output so we can confirm frames were loaded
-            try:
-                print("AnimatedGIF: loaded", len(self.frames), "frames")
-            except Exception:
-                pass
-            # Only animate if there are multiple frames
-            if len(self.frames) > 1:
-                self.animate()
-
-    def animate(self):
-        """Cycle through frames"""
-        if not self.frames:
-            return
-        self.index = (self.index + 1) % len(self.frames)
-        # update current image reference
-        self._current_image = self.frames[self.index]
-        self.configure(image=self._current_image)
-        self.after(self.delay, self.animate)
-
+from animated_gif import AnimatedGIF
 
 # --- Splash Screen with Background + GIF ---
 class SplashScreen(tk.Toplevel):
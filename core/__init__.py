@@ -0,0 +1,6 @@
+"""Tk-free logic behind the visualizers: importable and measurable without a display."""
+from .debt import WIN_MARGIN, new_game, outcome, result_message, simulate, simulate_games, winning_payments
+from .linked_lists import CircularLinkedList, DoublyLinkedList, DoublyNode, Node, SinglyLinkedList
+from .recursion import RecursionDemo, TraceEvent, parse_list
+from .roster import load_roster, open_chunks
+from .stack import MAX_CHARS, MAX_STACK, Stack, StackError
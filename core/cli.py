@@ -0,0 +1,218 @@
+"""Headless runner for the visualizer logic.
+
+    python -m core ops script.txt --structure doubly
+    python -m core attendance Ana Ben Carla   (or --file roster.csv --column name --dedupe)
+    python -m core bench-attendance --sizes 100 900 1000000
+    python -m core debt --debt 5000 --months 6 --payment 834
+    python -m core debt --games 1000000 --seed 1
+    python -m core debt --debt 5000 --months 6 --solve
+
+Operation scripts hold one command per line (``#`` starts a comment):
+``append X``, ``prepend X``, ``insert POS X``, ``delete X`` for the lists,
+``push X``, ``pop``, ``peek`` for the stack, and ``clear``/``display`` for
+both.
+"""
+import argparse
+import random
+import sys
+import time
+
+from . import debt
+from .linked_lists import CircularLinkedList, DoublyLinkedList, SinglyLinkedList
+from .roster import load_roster
+from .recursion import ENGINES, RecursionDemo, parse_list, recursion_fits
+from .stack import Stack, StackError
+
+STRUCTURES = {
+    "singly": SinglyLinkedList,
+    "doubly": DoublyLinkedList,
+    "circular": CircularLinkedList,
+    "stack": Stack,
+}
+
+
+def run_op(structure, line):
+    """Apply one script line; returns the text to print, if any"""
+    parts = line.split()
+    op, args = parts[0].lower(), parts[1:]
+    if op == "display":
+        return structure.display()
+    if op == "clear":
+        structure.clear()
+        return None
+    if isinstance(structure, Stack):
+        try:
+            if op == "push":
+                structure.push(" ".join(args))
+                return None
+            if op == "pop":
+                return f"popped {structure.pop()}"
+            if op == "peek":
+                return f"top {structure.peek()}"
+        except StackError as e:
+            return f"error: {e}"
+    else:
+        if op == "append":
+            structure.append(" ".join(args))
+            return None
+        if op == "prepend":
+            structure.prepend(" ".join(args))
+            return None
+        if op == "insert":
+            structure.insert_at_position(int(args[0]), " ".join(args[1:]))
+            return None
+        if op == "delete":
+            return structure.delete_by_value(" ".join(args))
+    raise ValueError(f"unknown operation '{op}'")
+
+
+def run_script(lines, structure, out=None):
+    count = 0
+    for lineno, raw in enumerate(lines, 1):
+        line = raw.split("#", 1)[0].strip()
+        if not line:
+            continue
+        try:
+            result = run_op(structure, line)
+        except (ValueError, IndexError) as e:
+            raise SystemExit(f"line {lineno}: {e}")
+        count += 1
+        if result and out is not None:
+            out.write(result + "\n")
+    return count
+
+
+def cmd_ops(args):
+    structure = STRUCTURES[args.structure]()
+    out = None if args.quiet else sys.stdout
+    t0 = time.perf_counter()
+    with open(args.script, "r", encoding="utf-8") as f:
+        count = run_script(f, structure, out)
+    elapsed = time.perf_counter() - t0
+    print(f"{count} operation(s) in {elapsed * 1000:.2f} ms", file=sys.stderr)
+
+
+def _read_roster(args):
+    if args.file:
+        try:
+            return load_roster(args.file, dedupe=args.dedupe, column=args.column, header=args.header)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"cannot read roster: {e}")
+    return parse_list(", ".join(args.names))
+
+
+def cmd_attendance(args):
+    students = _read_roster(args)
+    if not students:
+        raise SystemExit("no student names given")
+    if args.engine == "recursive" and not recursion_fits(len(students)):
+        raise SystemExit(f"{len(students)} names is too deep for the recursive engine; use --engine stack")
+    demo = RecursionDemo()
+    t0 = time.perf_counter()
+    for line in demo.attendance_report(students, args.engine):
+        if not args.quiet:
+            sys.stdout.write(line + "\n")
+    elapsed = time.perf_counter() - t0
+    print(f"{len(students)} student(s) in {elapsed * 1000:.2f} ms", file=sys.stderr)
+
+
+def _best_of(func, rounds):
+    best = None
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def cmd_bench_attendance(args):
+    # "same" also checks the lazy attendance_events trace the GUI streams
+    demo = RecursionDemo()
+    print(f"{'names':>9} {'stack ms':>9} {'recursive ms':>13}  same")
+    for size in args.sizes:
+        students = [f"student {i}" for i in range(size)]
+        stack_s, expected = _best_of(lambda: demo.attendance_report(students, "stack"), args.rounds)
+        if recursion_fits(size):
+            rec_s, got = _best_of(lambda: demo.attendance_report(students, "recursive"), args.rounds)
+            same = got == expected == list(demo.attendance_lines(students))
+            print(f"{size:>9} {stack_s * 1000:>9.2f} {rec_s * 1000:>13.2f}  {'yes' if same else 'NO'}")
+        else:
+            print(f"{size:>9} {stack_s * 1000:>9.2f} {'too deep':>13}     -")
+
+
+def cmd_debt(args):
+    if args.games < 0:
+        raise SystemExit("--games must be at least 1")
+    if args.months is not None and args.months < 1:
+        raise SystemExit("--months must be at least 1")
+    if args.games:
+        t0 = time.perf_counter()
+        results = debt.simulate_games(args.games, args.payment, args.seed)
+        elapsed = time.perf_counter() - t0
+        for name, count in results.items():
+            print(f"{name:<10} {count:>9}  {count / args.games:6.1%}")
+        engine = "numpy" if debt.HAS_NUMPY else "python"
+        print(f"{args.games} game(s) in {elapsed * 1000:.2f} ms ({engine})", file=sys.stderr)
+        return
+
+    game = debt.new_game(random.Random(args.seed))
+    total = args.debt if args.debt is not None else game["debt"]
+    months = args.months if args.months is not None else game["months"]
+    if args.solve:
+        wins = debt.winning_payments(total, months)
+        print(f"Your debt: ₱{total:,}  Months to pay: {months}")
+        if wins:
+            print(f"Winning monthly payments: ₱{wins[0]:,} to ₱{wins[-1]:,}")
+        else:
+            print("No whole-peso monthly payment wins this game.")
+        return
+    if args.payment is None:
+        raise SystemExit("--payment is required for a single game")
+    print(f"Your debt: ₱{total:,}  Months to pay: {months}")
+    remaining = total
+    for month, remaining in enumerate(debt.simulate(total, months, args.payment), 1):
+        print(f"Month {month} - Remaining debt: ₱{max(remaining, 0):,}")
+    print(debt.result_message(remaining))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m core", description="Run the visualizer logic without a GUI.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ops = sub.add_parser("ops", help="run an operation script against a list or the stack")
+    ops.add_argument("script")
+    ops.add_argument("--structure", choices=sorted(STRUCTURES), default="singly")
+    ops.add_argument("--quiet", action="store_true", help="only print the timing")
+    ops.set_defaults(func=cmd_ops)
+
+    att = sub.add_parser("attendance", help="call attendance with head recursion")
+    att.add_argument("names", nargs="*")
+    att.add_argument("--file", help="roster file: text (one name per line) or .csv")
+    att.add_argument("--column", help="CSV column index or header name (default: a 'name' column, else the first)")
+    att.add_argument("--header", action="store_true", help="skip the CSV header row when --column is an index")
+    att.add_argument("--dedupe", action="store_true", help="drop repeated names from the roster file")
+    att.add_argument("--engine", choices=ENGINES, default="stack")
+    att.add_argument("--quiet", action="store_true", help="only print the timing")
+    att.set_defaults(func=cmd_attendance)
+
+    bench = sub.add_parser("bench-attendance", help="time the stack engine against the recursive reference")
+    bench.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 900, 100000, 1000000])
+    bench.add_argument("--rounds", type=int, default=3)
+    bench.set_defaults(func=cmd_bench_attendance)
+
+    dbt = sub.add_parser("debt", help="play the debt game")
+    dbt.add_argument("--debt", type=int)
+    dbt.add_argument("--months", type=int)
+    dbt.add_argument("--payment", type=int)
+    dbt.add_argument("--games", type=int, default=0, help="simulate this many random games")
+    dbt.add_argument("--seed", type=int)
+    dbt.add_argument("--solve", action="store_true", help="print the winning payment range instead of playing")
+    dbt.set_defaults(func=cmd_debt)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+    return 0
@@ -0,0 +1,120 @@
+"""Tail-recursion debt game rules, shared by the GUI and the CLI."""
+import importlib.util
+import random
+
+# NumPy is only imported by simulate_games, so importing core stays cheap
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+# Final debt within this many pesos of zero counts as a win
+WIN_MARGIN = 5
+
+WIN = "win"
+OVERPAID = "overpaid"
+STILL_OWE = "still_owe"
+
+# new_game() draws debt and months uniformly from these inclusive ranges
+DEBT_RANGE = (1000, 9999)
+MONTHS_RANGE = (3, 12)
+
+# Games simulated per NumPy batch. Each batch holds about six int64/float64
+# arrays of this length (~0.8 MB each), so scratch stays around 5 MB
+SIM_BATCH = 100_000
+
+
+def new_game(rng=random):
+    return {
+        "debt": rng.randint(*DEBT_RANGE),
+        "months": rng.randint(*MONTHS_RANGE),
+    }
+
+
+def pay_month(remaining, payment):
+    """Remaining debt after one monthly payment"""
+    return remaining - payment
+
+
+def simulate(debt, months, payment):
+    """Remaining debt after each month, first month first"""
+    remaining = debt
+    history = []
+    for _ in range(months):
+        remaining = pay_month(remaining, payment)
+        history.append(remaining)
+    return history
+
+
+def final_debt(debt, months, payment):
+    return debt - months * payment
+
+
+def winning_payments(debt, months, margin=WIN_MARGIN):
+    """The whole-peso monthly payments that win, as a range (possibly empty).
+
+    A payment wins when ``|debt - months * payment| <= margin``, i.e. when
+    ``months * payment`` lies in ``[debt - margin, debt + margin]``.
+    """
+    if months < 1:
+        raise ValueError("months must be at least 1")
+    low = -(-(debt - margin) // months)
+    high = (debt + margin) // months
+    return range(low, max(low, high + 1))
+
+
+def outcome(remaining, margin=WIN_MARGIN):
+    if abs(remaining) <= margin:
+        return WIN
+    if remaining < -margin:
+        return OVERPAID
+    return STILL_OWE
+
+
+def result_message(remaining):
+    result = outcome(remaining)
+    if result == WIN:
+        return f"Final debt: ₱{remaining:,} and YOU WIN!\nDebt cleared within ₱{WIN_MARGIN} margin."
+    if result == OVERPAID:
+        return f"YOU LOSE!\nYou overpaid by ₱{abs(remaining):,}"
+    return f"YOU LOSE!\nYou still owe ₱{remaining:,}"
+
+
+def simulate_games(games, payment=None, seed=None, margin=WIN_MARGIN):
+    """Play ``games`` random games and count the outcomes.
+
+    Every game pays ``payment`` a month, or the rounded even split of its
+    debt when ``payment`` is None.  Returns a dict with the counts for
+    WIN, OVERPAID and STILL_OWE plus ``"winnable"``, the number of games
+    that have any winning whole-peso payment.  With NumPy the games are
+    drawn and scored as arrays, ``SIM_BATCH`` at a time.
+    """
+    counts = {WIN: 0, OVERPAID: 0, STILL_OWE: 0, "winnable": 0}
+    if not HAS_NUMPY:
+        rng = random.Random(seed)
+        for _ in range(games):
+            game = new_game(rng)
+            pay = payment if payment is not None else round(game["debt"] / game["months"])
+            counts[outcome(final_debt(game["debt"], game["months"], pay), margin)] += 1
+            counts["winnable"] += len(winning_payments(game["debt"], game["months"], margin)) > 0
+        return counts
+
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    left = games
+    while left > 0:
+        n = min(left, SIM_BATCH)
+        left -= n
+        debts = rng.integers(DEBT_RANGE[0], DEBT_RANGE[1] + 1, n)
+        months = rng.integers(MONTHS_RANGE[0], MONTHS_RANGE[1] + 1, n)
+        if payment is None:
+            pay = np.rint(debts / months).astype(np.int64)
+        else:
+            pay = payment
+        final = debts - months * pay
+        won = np.abs(final) <= margin
+        counts[WIN] += int(won.sum())
+        counts[OVERPAID] += int((final < -margin).sum())
+        counts[STILL_OWE] += int((final > margin).sum())
+        low = -(-(debts - margin) // months)
+        high = (debts + margin) // months
+        counts["winnable"] += int((high >= low).sum())
+    return counts
@@ -0,0 +1,196 @@
+"""Singly, doubly and circular linked lists used by the Linked List visualizer."""
+
+
+class Node:
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+class DoublyNode:
+    def __init__(self, data):
+        self.data = data
+        self.prev = None
+        self.next = None
+
+class SinglyLinkedList:
+    def __init__(self):
+        self.head = None
+
+    def append(self, data):
+        new_node = Node(data)
+        if not self.head:
+            self.head = new_node
+            return
+        cur = self.head
+        while cur.next:
+            cur = cur.next
+        cur.next = new_node
+
+    def prepend(self, data):
+        new_node = Node(data)
+        new_node.next = self.head
+        self.head = new_node
+
+    def insert_at_position(self, pos, data):
+        new_node = Node(data)
+        if pos <= 1 or not self.head:
+            self.prepend(data)
+            return
+        cur = self.head
+        count = 1
+        while cur.next and count < pos - 1:
+            cur = cur.next
+            count += 1
+        new_node.next = cur.next
+        cur.next = new_node
+
+    def delete_by_value(self, value):
+        if not self.head:
+            return "List is empty."
+
+        if self.head.data == value:
+            self.head = self.head.next
+            return
+
+        cur = self.head
+        while cur.next and cur.next.data != value:
+            cur = cur.next
+
+        if cur.next:
+            cur.next = cur.next.next
+        else:
+            return f"Value '{value}' not found."
+
+    def display(self):
+        values = []
+        cur = self.head
+        while cur:
+            values.append(str(cur.data))
+            cur = cur.next
+        return " -> ".join(values) if values else "List is empty."
+
+    def get_nodes(self):
+        nodes = []
+        cur = self.head
+        while cur:
+            nodes.append(str(cur.data))
+            cur = cur.next
+        return nodes
+
+    def clear(self):
+        self.head = None
+
+class DoublyLinkedList(SinglyLinkedList):
+    def append(self, data):
+        new_node = DoublyNode(data)
+        if not hasattr(self, "head") or not self.head:
+            self.head = new_node
+            return
+        cur = self.head
+        while cur.next:
+            cur = cur.next
+        cur.next = new_node
+        new_node.prev = cur
+
+    def prepend(self, data):
+        new_node = DoublyNode(data)
+        if self.head:
+            self.head.prev = new_node
+        new_node.next = self.head
+        self.head = new_node
+
+    def insert_at_position(self, pos, data):
+        new_node = DoublyNode(data)
+        if pos <= 1 or not self.head:
+            self.prepend(data)
+            return
+        cur = self.head
+        count = 1
+        while cur.next and count < pos - 1:
+            cur = cur.next
+            count += 1
+        
+        new_node.next = cur.next
+        new_node.prev = cur
+        if cur.next:
+            cur.next.prev = new_node
+        cur.next = new_node
+
+class CircularLinkedList(SinglyLinkedList):
+    def append(self, data):
+        new_node = Node(data)
+        if not self.head:
+            self.head = new_node
+            new_node.next = self.head
+            return
+        cur = self.head
+        while cur.next != self.head:
+            cur = cur.next
+        cur.next = new_node
+        new_node.next = self.head
+
+    def prepend(self, data):
+        new_node = Node(data)
+        if not self.head:
+            self.head = new_node
+            new_node.next = new_node
+            return
+        
+        last = self.head
+        while last.next != self.head:
+            last = last.next
+        
+        new_node.next = self.head
+        last.next = new_node
+        self.head = new_node
+
+    def get_nodes(self):
+        nodes = []
+        if not self.head:
+            return nodes
+        cur = self.head
+        while True:
+            nodes.append(str(cur.data))
+            cur = cur.next
+            if cur == self.head:
+                break
+        return nodes
+
+    def display(self):
+        if not self.head:
+            return "List is empty."
+        cur = self.head
+        result = []
+        while True:
+            result.append(str(cur.data))
+            cur = cur.next
+            if cur == self.head:
+                break
+        return " -> ".join(result) + " -> (back to head)"
+
+    def delete_by_value(self, value):
+        if not self.head:
+            return "List is empty."
+
+        if self.head.data == value:
+            if self.head.next == self.head:
+                self.head = None
+                return
+            
+            last = self.head
+            while last.next != self.head:
+                last = last.next
+            self.head = self.head.next
+            last.next = self.head
+            return
+
+        prev = self.head
+        cur = self.head.next
+        while cur != self.head and cur.data != value:
+            prev = cur
+            cur = cur.next
+
+        if cur == self.head:
+            return f"Value '{value}' not found."
+        
+        prev.next = cur.next
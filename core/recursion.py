@@ -0,0 +1,119 @@
+"""Head-recursion attendance demo used by the Recursion visualizer."""
+import sys
+from collections import namedtuple
+
+LAST_REACHED = "Last student reached. Now reporting back."
+REPORT_HEADER = "Reporting order (last student -> first student):"
+
+# Kinds of trace event: a frame being entered, a frame returning (the
+# base case returns with no name) and the numbered report that follows
+CALL = "call"
+RETURN = "return"
+REPORT = "report"
+
+# ``text`` is the line the visualizer prints for the event, None for silent ones
+TraceEvent = namedtuple("TraceEvent", "kind depth name text")
+
+# ``stack`` simulates the recursion with an explicit frame stack and handles
+# any roster size; ``recursive`` is the original, kept as the reference.
+# attendance_events is the lazy view of the same trace used for streaming
+ENGINES = ("stack", "recursive")
+
+
+def parse_list(raw):
+    items = [s.strip().title() if ',' in raw else s.strip() for s in raw.split(",") if s.strip()]
+    return items
+
+
+def recursion_fits(count, margin=50):
+    """Whether the recursive engine can take ``count`` names under the current limit"""
+    return count + margin < sys.getrecursionlimit()
+
+
+class RecursionDemo:
+    def __init__(self):
+        self.MONTHS = [
+            "January", "February", "March", "April", "May", "June",
+            "July", "August", "September", "October", "November", "December"
+        ]
+
+    def head_recursion_attendance(self, students, engine="stack"):
+        """(present, trace) for calling attendance with head recursion"""
+        if engine == "recursive":
+            return self.head_recursion_attendance_recursive(students)
+        if engine != "stack":
+            raise ValueError(f"unknown engine '{engine}'")
+        return self.head_recursion_attendance_stack(students)
+
+    def head_recursion_attendance_recursive(self, students, idx=0, present=None, trace=None):
+        if present is None:
+            present = []
+        if trace is None:
+            trace = []
+        if idx == 0:
+            students = [name.strip().title() for name in students]
+
+        if idx >= len(students):
+            trace.append(LAST_REACHED)
+            return present, trace
+
+        present, trace = self.head_recursion_attendance_recursive(students, idx + 1, present, trace)
+        name = students[idx]
+        trace.append(f"{name} says: Present!")
+        present.append(name)
+        return present, trace
+
+    def head_recursion_attendance_stack(self, students):
+        """Same result as the recursive engine, with the call frames kept in a list"""
+        students = [name.strip().title() for name in students]
+        present = []
+        trace = []
+        frames = []
+        push = frames.append
+
+        # Calling phase: each call pushes its frame (idx and the name it
+        # will report) and calls idx + 1, until the base case is reached
+        for frame in enumerate(students):
+            push(frame)
+        trace.append(LAST_REACHED)
+
+        # Returning phase: frames report back innermost first
+        pop = frames.pop
+        while frames:
+            idx, name = pop()
+            trace.append(f"{name} says: Present!")
+            present.append(name)
+        return present, trace
+
+    def attendance_events(self, students, calls=True):
+        """Lazily yield the TraceEvents of the attendance call, in display order.
+
+        ``students`` must be a sequence; names are normalised as they are
+        reached, so nothing but the roster itself is held in memory.  With
+        ``calls=False`` the silent call events are skipped and the first
+        line comes out without walking the roster first.
+        """
+        count = len(students)
+        if calls:
+            for idx in range(count):
+                yield TraceEvent(CALL, idx, students[idx].strip().title(), None)
+        yield TraceEvent(RETURN, count, None, LAST_REACHED)
+        for idx in reversed(range(count)):
+            name = students[idx].strip().title()
+            yield TraceEvent(RETURN, idx, name, f"{name} says: Present!")
+        yield TraceEvent(REPORT, 0, None, "")
+        yield TraceEvent(REPORT, 0, None, REPORT_HEADER)
+        for order, idx in enumerate(reversed(range(count)), 1):
+            name = students[idx].strip().title()
+            yield TraceEvent(REPORT, idx, name, f"{order}. {name}")
+
+    def attendance_lines(self, students):
+        """The printed lines of :meth:`attendance_events`, one at a time"""
+        for event in self.attendance_events(students, calls=False):
+            yield event.text
+
+    def attendance_report(self, students, engine="stack"):
+        """Trace lines followed by the numbered reporting order, as the GUI shows them"""
+        present, trace = self.head_recursion_attendance(students, engine)
+        return (trace + ["", REPORT_HEADER]
+                + [f"{i+1}. {name}" for i, name in enumerate(present)])
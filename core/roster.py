@@ -0,0 +1,114 @@
+"""Streaming roster import for the attendance demo.
+
+Class lists are read from CSV or plain-text files a chunk of names at a
+time, normalised the way the attendance engine prints them and
+optionally de-duplicated as they stream in.
+"""
+import csv
+import os
+
+# Names handed out per chunk
+CHUNK_SIZE = 5000
+
+# Header cells that mark the name column when no column is given
+NAME_HEADERS = ("name", "names", "student", "students", "student name", "full name")
+
+
+def normalize(name):
+    """``"  ana   maria "`` -> ``"Ana Maria"``; empty names come back as ``""``"""
+    return " ".join(name.split()).title()
+
+
+def _csv_names(f, column, header):
+    reader = csv.reader(f)
+    if column is None:
+        first = next(reader, None)
+        if first is None:
+            return
+        cells = [cell.strip().lower() for cell in first]
+        index = next((i for i, cell in enumerate(cells) if cell in NAME_HEADERS), None)
+        if index is None:
+            # No recognisable header: the first row is already a student
+            index = 0
+            if first:
+                yield first[0]
+    elif isinstance(column, str) and not column.isdigit():
+        header = next(reader, None)
+        if header is None:
+            return
+        wanted = column.strip().lower()
+        for index, cell in enumerate(header):
+            if cell.strip().lower() == wanted:
+                break
+        else:
+            raise ValueError(f"no column named '{column}' in the CSV header")
+    else:
+        index = int(column)
+        if header:
+            next(reader, None)
+    for row in reader:
+        if index < len(row):
+            yield row[index]
+
+
+def _text_names(f):
+    # One name per line; comma-separated lines work too, like the entry box
+    for line in f:
+        yield from line.split(",")
+
+
+def iter_names(f, fmt="text", column=None, header=False):
+    """Raw names from an open file, one at a time.
+
+    ``column`` picks the CSV column by index or by header name; a named
+    column always reads the first row as the header, an index only skips
+    it when ``header`` is set.  With ``column=None`` the first row is
+    checked for a name-like header and column 0 is used otherwise.
+    """
+    if fmt == "csv":
+        return _csv_names(f, column, header)
+    return _text_names(f)
+
+
+def guess_format(path):
+    return "csv" if os.path.splitext(path)[1].lower() == ".csv" else "text"
+
+
+def iter_chunks(names, chunk_size=CHUNK_SIZE, dedupe=False):
+    """Lists of at most ``chunk_size`` normalised, non-empty names.
+
+    With ``dedupe`` only the first occurrence of each name is kept; the
+    set of seen names shares its strings with the chunks, so it costs
+    references rather than a second copy of the roster.
+    """
+    seen = set() if dedupe else None
+    chunk = []
+    for raw in names:
+        name = normalize(raw)
+        if not name:
+            continue
+        if seen is not None:
+            if name in seen:
+                continue
+            seen.add(name)
+        chunk.append(name)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def open_chunks(path, chunk_size=CHUNK_SIZE, dedupe=False, column=None, header=False, fmt=None):
+    """Stream ``path`` as chunks of names; the file is closed when the generator finishes"""
+    fmt = fmt or guess_format(path)
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        yield from iter_chunks(iter_names(f, fmt, column, header), chunk_size, dedupe)
+
+
+def load_roster(path, dedupe=False, column=None, header=False, fmt=None):
+    """The whole roster of ``path`` as one list, built chunk by chunk"""
+    roster = []
+    for chunk in open_chunks(path, dedupe=dedupe, column=column, header=header, fmt=fmt):
+        roster.extend(chunk)
+    return roster
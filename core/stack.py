@@ -0,0 +1,83 @@
+"""Bounded stack used by the Stack visualizer."""
+
+MAX_STACK = 10
+MAX_CHARS = 36
+
+# Reasons a stack operation can be refused
+EMPTY_VALUE = "empty_value"
+NOT_NUMERIC = "not_numeric"
+OVERFLOW = "overflow"
+UNDERFLOW = "underflow"
+
+
+class StackError(Exception):
+    def __init__(self, reason, message):
+        super().__init__(message)
+        self.reason = reason
+
+
+class Stack:
+    """A stack of numeric strings with a fixed capacity.
+
+    Values longer than ``max_chars`` are shortened with an ellipsis, the
+    way the visualizer shows them.
+    """
+
+    def __init__(self, capacity=MAX_STACK, max_chars=MAX_CHARS):
+        self.capacity = capacity
+        self.max_chars = max_chars
+        self.items = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __reversed__(self):
+        return reversed(self.items)
+
+    def is_full(self):
+        return len(self.items) >= self.capacity
+
+    def validate(self, value):
+        """Reason ``value`` cannot be pushed, or None"""
+        value = value.strip()
+        if not value:
+            return EMPTY_VALUE
+        if not value.isdigit():
+            return NOT_NUMERIC
+        if self.is_full():
+            return OVERFLOW
+        return None
+
+    def push(self, value):
+        """Push ``value`` and return it as stored; raises StackError when refused"""
+        reason = self.validate(value)
+        if reason == EMPTY_VALUE:
+            raise StackError(reason, "Cannot push empty value.")
+        if reason == NOT_NUMERIC:
+            raise StackError(reason, "Invalid input: non-numeric characters detected.")
+        if reason == OVERFLOW:
+            raise StackError(reason, "Overflow! Cannot add more stacks.")
+        value = value.strip()
+        if len(value) > self.max_chars:
+            value = value[:self.max_chars - 3] + '...'
+        self.items.append(value)
+        return value
+
+    def pop(self):
+        if not self.items:
+            raise StackError(UNDERFLOW, "Pop failed: stack is empty.")
+        return self.items.pop()
+
+    def peek(self):
+        if not self.items:
+            raise StackError(UNDERFLOW, "Peek: stack is empty.")
+        return self.items[-1]
+
+    def clear(self):
+        self.items.clear()
+
+    def display(self):
+        return " | ".join(reversed(self.items)) + " (top first)" if self.items else "Stack is empty."
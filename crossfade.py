@@ -0,0 +1,167 @@
+import importlib.util
+import threading
+
+try:
+    from PIL import Image, ImageTk
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+# NumPy is only imported once a crossfade is actually blended, so
+# importing this module stays cheap during startup
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+import image_budget
+
+# Frames blended per NumPy batch; keeps the float32 scratch space small
+BLEND_BATCH = 8
+
+
+def blend_frames(start, end, steps):
+    """Return ``steps + 1`` images fading from ``start`` to ``end``.
+
+    With NumPy every frame of the ramp is computed as one vectorized
+    ``start + (end - start) * alpha`` over the whole image; without it
+    this falls back to ``Image.blend`` per step.
+    """
+    if start.size != end.size:
+        start = start.resize(end.size)
+    if start.mode != end.mode:
+        start = start.convert(end.mode)
+    steps = max(1, steps)
+
+    if not HAS_NUMPY:
+        return [Image.blend(start, end, i / steps) for i in range(steps + 1)]
+
+    import numpy as np
+
+    a = np.asarray(start, dtype=np.float32)
+    diff = np.asarray(end, dtype=np.float32) - a
+    alphas = np.linspace(0.0, 1.0, steps + 1, dtype=np.float32)
+    frames = []
+    for lo in range(0, len(alphas), BLEND_BATCH):
+        ramp = alphas[lo:lo + BLEND_BATCH].reshape((-1,) + (1,) * a.ndim)
+        batch = a + diff * ramp
+        np.clip(batch, 0, 255, out=batch)
+        batch = (batch + 0.5).astype(np.uint8)
+        frames.extend(Image.fromarray(f, end.mode) for f in batch)
+    return frames
+
+
+class Crossfade:
+    """Fades a label from one PIL image to another.
+
+    The blend frames are computed on a worker thread; the Tk side only
+    pastes each prepared frame into a single PhotoImage on every tick.
+    """
+
+    def __init__(self, label, start, end, steps=25, interval=40, on_done=None):
+        self.label = label
+        self.start_image = start
+        self.end_image = end
+        self.steps = steps
+        self.interval = interval
+        self.on_done = on_done
+        self.photo = None
+        self._frames = None
+        self._error = None
+        self._index = 0
+        self._after_id = None
+        self._memory = None
+        self._done = False
+        self._end_replaced = False
+
+    def start(self):
+        if self.start_image.size != self.end_image.size:
+            self.start_image = self.start_image.resize(self.end_image.size)
+        self.photo = ImageTk.PhotoImage(self.start_image)
+        self._show()
+        threading.Thread(target=self._prepare, name="crossfade", daemon=True).start()
+        self._after_id = self.label.after(self.interval, self._poll)
+
+    def _prepare(self):
+        try:
+            self._frames = blend_frames(self.start_image, self.end_image, self.steps)
+        except Exception as e:
+            self._error = e
+
+    def _show(self):
+        self.label.config(image=self.photo)
+        self.label.image = self.photo
+
+    def _poll(self):
+        self._after_id = None
+        if self._error is not None:
+            print(f"Crossfade failed: {self._error}. Showing final image.")
+            self.finish()
+            return
+        if self._frames is None:
+            self._after_id = self.label.after(10, self._poll)
+            return
+        self._memory = image_budget.register("Crossfade", getattr(self.end_image, "filename", None),
+                                             evict=self.finish)
+        self._memory.update(sum(image_budget.pil_bytes(f) for f in self._frames), len(self._frames))
+        self._index = 1
+        self._step()
+
+    def _step(self):
+        self._after_id = None
+        try:
+            if not self.label.winfo_exists():
+                self._release()
+                return
+            if self._index >= len(self._frames):
+                self._release()
+                self._done = True
+                if self._end_replaced:
+                    self.photo.paste(self.end_image)
+                if self.on_done is not None:
+                    self.on_done()
+                return
+            self.photo.paste(self._frames[self._index])
+            self._memory.touch()
+        except Exception:
+            self.finish()
+            return
+        self._index += 1
+        self._after_id = self.label.after(self.interval, self._step)
+
+    def finish(self):
+        """Jump straight to the end image"""
+        self.cancel()
+        try:
+            self.photo = ImageTk.PhotoImage(self.end_image)
+            self._show()
+        except Exception:
+            pass
+        self._release()
+        self._done = True
+        if self.on_done is not None:
+            self.on_done()
+
+    def set_end_image(self, img):
+        """Swap in a better end image, e.g. the result of a background LANCZOS pass"""
+        if img.size != self.end_image.size:
+            img = img.resize(self.end_image.size)
+        self.end_image = img
+        if self._done and self.photo is not None:
+            try:
+                self.photo.paste(img)
+            except Exception:
+                pass
+        else:
+            self._end_replaced = True
+
+    def _release(self):
+        self._frames = None
+        if self._memory is not None:
+            self._memory.release()
+            self._memory = None
+
+    def cancel(self):
+        if self._after_id is not None:
+            try:
+                self.label.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
@@ -0,0 +1,243 @@
+import hashlib
+import json
+import os
+import threading
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import ImageTk
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+import asset_bundle
+import profiler
+import resampling
+
+# Processed (converted + resized/cropped) frames are written here as PNGs so
+# later launches can hand them straight to Tk without decoding the source or
+# running LANCZOS again. Set VISUALIZER_FRAME_CACHE to move it, or to "off".
+CACHE_DIR = os.environ.get("VISUALIZER_FRAME_CACHE") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".frame_cache")
+CACHE_VERSION = 1
+INDEX_FILE = "frames.json"
+
+# How a frame reaches its target size; see resampling.prepare_frame
+CROP_MODES = (None, "center", "fit")
+
+_hash_memo = {}
+_writer_pool = None
+_writer_pool_lock = threading.Lock()
+
+
+def enabled():
+    return CACHE_DIR.lower() != "off"
+
+
+def source_hash(path):
+    """SHA-1 of the file contents, memoised per (path, mtime, size)"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    memo_key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    digest = _hash_memo.get(memo_key)
+    if digest is None:
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        _hash_memo[memo_key] = digest
+    return digest
+
+
+def cache_key(path, target_size, crop=None):
+    digest = source_hash(path)
+    if digest is None:
+        return None
+    size = f"{target_size[0]}x{target_size[1]}" if target_size else "orig"
+    return f"{digest[:20]}-{size}-{crop or 'resize'}-v{CACHE_VERSION}"
+
+
+class CachedFrames:
+    """Read side of one cache entry: PNG frames plus their durations"""
+
+    def __init__(self, folder, index):
+        self.folder = folder
+        self.frame_count = index["count"]
+        self.durations = index.get("durations") or [None] * self.frame_count
+        self.size = tuple(index.get("size") or ())
+
+    def frame_path(self, index):
+        return os.path.join(self.folder, f"{index:04d}.png")
+
+    def load(self, index):
+        try:
+            return tk.PhotoImage(file=self.frame_path(index))
+        except tk.TclError:
+            return None
+
+
+def lookup(path, target_size=None, crop=None):
+    if not enabled() or not path:
+        return None
+    key = cache_key(path, target_size, crop)
+    if key is None:
+        return None
+    folder = os.path.join(CACHE_DIR, key)
+    try:
+        with open(os.path.join(folder, INDEX_FILE), "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != CACHE_VERSION or not index.get("count"):
+        return None
+    return CachedFrames(folder, index)
+
+
+def _pool():
+    # Called from the Tk thread and from warm-up workers alike
+    global _writer_pool
+    with _writer_pool_lock:
+        if _writer_pool is None:
+            _writer_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="frame-cache")
+        return _writer_pool
+
+
+class FrameCacheWriter:
+    """Collects processed frames and publishes the entry once all are written.
+
+    PNG encoding happens on a single background thread so the first launch
+    is not slowed down by the cache fill; ``add(..., wait=True)`` writes on
+    the calling thread instead, for callers that already run off the Tk
+    thread and need the entry to exist when they return.
+    """
+
+    def __init__(self, path, target_size, crop, frame_count):
+        self.frame_count = frame_count
+        self.target_size = target_size
+        self.folder = None
+        self._durations = [None] * frame_count
+        self._pending = set(range(frame_count))
+        key = cache_key(path, target_size, crop) if enabled() else None
+        if key is not None:
+            self.folder = os.path.join(CACHE_DIR, key)
+
+    def add(self, index, frame, duration=None, wait=False):
+        if self.folder is None or index not in self._pending:
+            return
+        self._pending.discard(index)
+        self._durations[index] = duration
+        done = not self._pending
+        durations = list(self._durations) if done else None
+        if wait:
+            self._write(index, frame, durations)
+        else:
+            _pool().submit(self._write, index, frame, durations)
+
+    def _write(self, index, frame, durations):
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            frame.save(os.path.join(self.folder, f"{index:04d}.png"), "PNG", compress_level=1)
+            if durations is not None:
+                index_data = {
+                    "version": CACHE_VERSION,
+                    "count": self.frame_count,
+                    "durations": durations,
+                    "size": list(frame.size),
+                }
+                # Per-thread temp name: a warm-up worker and the Tk thread may publish the same entry
+                tmp = os.path.join(self.folder, f"{INDEX_FILE}.{os.getpid()}.{threading.get_ident()}.tmp")
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(index_data, f)
+                os.replace(tmp, os.path.join(self.folder, INDEX_FILE))
+        except Exception as e:
+            print(f"Frame cache: could not write {self.folder}: {e}")
+            self.folder = None
+
+
+def load_all(path, target_size=None, crop=None, refiner=None):
+    """Return (photos, durations) for every processed frame of ``path``.
+
+    Served from the disk cache when possible, otherwise decoded with Pillow
+    and written to the cache for the next launch. With a
+    :class:`resampling.Refiner` the photos start as fast drafts and are
+    upgraded in place once the LANCZOS pass finishes in the background.
+    """
+    path = asset_bundle.resolve_image(path, target_size, crop)
+    with profiler.span(f"load {os.path.basename(path)}", "asset"):
+        return _load_all(path, target_size, crop, refiner)
+
+
+def _load_all(path, target_size, crop, refiner):
+    cached = lookup(path, target_size, crop)
+    if cached is not None:
+        photos = [cached.load(i) for i in range(cached.frame_count)]
+        if all(p is not None for p in photos):
+            return photos, list(cached.durations)
+
+    if not HAS_PIL:
+        return [], []
+
+    two_tier = refiner is not None and target_size is not None
+    img, src_size = resampling.open_image(path, target_size, crop, draft=two_tier)
+    reopen = path if img.size != src_size else None
+    count = getattr(img, "n_frames", 1)
+    writer = FrameCacheWriter(path, target_size, crop, count)
+    photos, durations = [], []
+    for i in range(count):
+        try:
+            img.seek(i)
+        except EOFError:
+            break
+        duration = img.info.get("duration")
+        raw = img.copy()
+        if two_tier:
+            draft = resampling.prepare_frame(raw, target_size, crop, resampling.DRAFT_FILTER, src_size)
+            photo = ImageTk.PhotoImage(draft)
+            refiner.submit(resampling.refine_job(raw, target_size, crop, reopen),
+                           _refined(writer, i, photo, duration))
+        else:
+            frame = resampling.prepare_frame(raw, target_size, crop)
+            writer.add(i, frame, duration)
+            photo = ImageTk.PhotoImage(frame)
+        photos.append(photo)
+        durations.append(duration)
+    return photos, durations
+
+
+def warm(path, target_size=None, crop=None):
+    """Decode and resize ``path`` straight into the disk cache.
+
+    Never touches Tk, so it can run on a worker thread (e.g. during the
+    splash).  The PNGs and the index are written before it returns, so
+    the next :func:`load_all` or FrameSource reads them.  Returns the
+    number of frames processed.
+    """
+    path = asset_bundle.resolve_image(path, target_size, crop)
+    if not HAS_PIL or not enabled() or lookup(path, target_size, crop) is not None:
+        return 0
+    with profiler.span(f"warm {os.path.basename(path)}", "asset"):
+        return _warm(path, target_size, crop)
+
+
+def _warm(path, target_size, crop):
+    img, _ = resampling.open_image(path, target_size, crop)
+    count = getattr(img, "n_frames", 1)
+    writer = FrameCacheWriter(path, target_size, crop, count)
+    for i in range(count):
+        try:
+            img.seek(i)
+        except EOFError:
+            break
+        writer.add(i, resampling.prepare_frame(img.copy(), target_size, crop), img.info.get("duration"), wait=True)
+    return count
+
+
+def _refined(writer, index, photo, duration):
+    def apply(frame):
+        writer.add(index, frame, duration)
+        photo.paste(frame)
+    return apply
@@ -3,199 +3,8 @@ from tkinter import ttk, messagebox, simpledialog
 import random
 import time
 
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
-
-class DoublyNode:
-    def __init__(self, data):
-        self.data = data
-        self.prev = None
-        self.next = None
-
-class SinglyLinkedList:
-    def __init__(self):
-        self.head = None
-
-    def append(self, data):
-        new_node = Node(data)
-        if not self.head:
-            self.head = new_node
-            return
-        cur = self.head
-        while cur.next:
-            cur = cur.next
-        cur.next = new_node
-
-    def prepend(self, data):
-        new_node = Node(data)
-        new_node.next = self.head
-        self.head = new_node
-
-    def insert_at_position(self, pos, data):
-        new_node = Node(data)
-        if pos <= 1 or not self.head:
-            self.prepend(data)
-            return
-        cur = self.head
-        count = 1
-        while cur.next and count < pos - 1:
-            cur = cur.next
-            count += 1
-        new_node.next = cur.next
-        cur.next = new_node
-
-    def delete_by_value(self, value):
-        if not self.head:
-            return "List is empty."
-
-        if self.head.data == value:
-            self.head = self.head.next
-            return
-
-        cur = self.head
-        while cur.next and cur.next.data != value:
-            cur = cur.next
-
-        if cur.next:
-            cur.next = cur.next.next
-        else:
-            return f"Value '{value}' not found."
-
-    def display(self):
-        values = []
-        cur = self.head
-        while cur:
-            values.append(str(cur.data))
-            cur = cur.next
-        return " -> ".join(values) if values else "List is empty."
-
-    def get_nodes(self):
-        nodes = []
-        cur = self.head
-        while cur:
-            nodes.append(str(cur.data))
-            cur = cur.next
-        return nodes
-
-    def clear(self):
-        self.head = None
-
-class DoublyLinkedList(SinglyLinkedList):
-    def append(self, data):
-        new_node = DoublyNode(data)
-        if not hasattr(self, "head") or not self.head:
-            self.head = new_node
-            return
-        cur = self.head
-        while cur.next:
-            cur = cur.next
-        cur.next = new_node
-        new_node.prev = cur
-
-    def prepend(self, data):
-        new_node = DoublyNode(data)
-        if self.head:
-            self.head.prev = new_node
-        new_node.next = self.head
-        self.head = new_node
-
-    def insert_at_position(self, pos, data):
-        new_node = DoublyNode(data)
-        if pos <= 1 or not self.head:
-            self.prepend(data)
-            return
-        cur = self.head
-        count = 1
-        while cur.next and count < pos - 1:
-            cur = cur.next
-            count += 1
-        
-        new_node.next = cur.next
-        new_node.prev = cur
-        if cur.next:
-            cur.next.prev = new_node
-        cur.next = new_node
-
-class CircularLinkedList(SinglyLinkedList):
-    def append(self, data):
-        new_node = Node(data)
-        if not self.head:
-            self.head = new_node
-            new_node.next = self.head
-            return
-        cur = self.head
-        while cur.next != self.head:
-            cur = cur.next
-        cur.next = new_node
-        new_node.next = self.head
-
-    def prepend(self, data):
-        new_node = Node(data)
-        if not self.head:
-            self.head = new_node
-            new_node.next = new_node
-            return
-        
-        last = self.head
-        while last.next != self.head:
-            last = last.next
-        
-        new_node.next = self.head
-        last.next = new_node
-        self.head = new_node
-
-    def get_nodes(self):
-        nodes = []
-        if not self.head:
-            return nodes
-        cur = self.head
-        while True:
-            nodes.append(str(cur.data))
-            cur = cur.next
-            if cur == self.head:
-                break
-        return nodes
-
-    def display(self):
-        if not self.head:
-            return "List is empty."
-        cur = self.head
-        result = []
-        while True:
-            result.append(str(cur.data))
-            cur = cur.next
-            if cur == self.head:
-                break
-        return " -> ".join(result) + " -> (back to head)"
-
-    def delete_by_value(self, value):
-        if not self.head:
-            return "List is empty."
-
-        if self.head.data == value:
-            if self.head.next == self.head:
-                self.head = None
-                return
-            
-            last = self.head
-            while last.next != self.head:
-                last = last.next
-            self.head = self.head.next
-            last.next = self.head
-            return
-
-        prev = self.head
-        cur = self.head.next
-        while cur != self.head and cur.data != value:
-            prev = cur
-            cur = cur.next
-
-        if cur == self.head:
-            return f"Value '{value}' not found."
-        
-        prev.next = cur.next
+from core.linked_lists import CircularLinkedList, DoublyLinkedList, SinglyLinkedList
+from sprites import SpriteLayer
 
 class LinkedListGUI:
     def __init__(self, root):
@@ -396,6 +205,7 @@ class LinkedListGUI:
 
         self.canvas = tk.Canvas(self.current_frame, width=900, height=360, highlightthickness=0, bg="#ffffff")
         self.canvas.pack(pady=6)
+        self.node_layer = SpriteLayer(self.canvas)
         
         self.x_scrollbar = ttk.Scrollbar(self.current_frame, orient="horizontal", command=self.canvas.xview)
         self.x_scrollbar.pack(fill="x", padx=20, pady=(0, 6)) 
@@ -463,8 +273,8 @@ class LinkedListGUI:
 
     def clear_visual(self, keep_logs=False):
         try:
-            if hasattr(self, "canvas") and self.canvas:
-                self.canvas.delete("all")
+            if getattr(self, "node_layer", None):
+                self.node_layer.clear()
         except Exception:
             pass
         if hasattr(self, "output_box") and self.output_box:
@@ -592,20 +402,23 @@ class LinkedListGUI:
 
     def animate_nodes(self, nodes):
         canvas = getattr(self, "canvas", None)
-        if not canvas:
+        layer = getattr(self, "node_layer", None)
+        if not canvas or not layer:
             return
         
         try:
-            canvas.delete("all")
             canvas.configure(bg="#ffffff")
         except Exception:
             pass
 
+        # Items are kept by key and updated in place; whatever is not drawn
+        # this time is hidden until it is needed again
+        layer.begin()
         if not nodes:
             try:
-                canvas.create_text(450, 180, text="List is empty.",
-                                   font=("Helvetica", 14, "italic"),
-                                   fill="#000000")
+                layer.sprite("empty", "text", (450, 180), z=3, text="List is empty.",
+                             font=("Helvetica", 14, "italic"),
+                             fill="#000000")
             except Exception:
                 pass
         
@@ -623,42 +436,47 @@ class LinkedListGUI:
                     centers.append((cx, cy))
                     
                     outline_color = "#000000"
-                    canvas.create_oval(cx - node_d // 2, cy - node_d // 2, cx + node_d // 2, cy + node_d // 2,
-                                       fill=self.node_fill, outline=outline_color, width=2)
-                    canvas.create_text(cx, cy, text=val, fill="#000000", font=("Helvetica", 12, "bold"))
+                    layer.sprite(("node", i), "oval",
+                                 (cx - node_d // 2, cy - node_d // 2, cx + node_d // 2, cy + node_d // 2), z=0,
+                                 fill=self.node_fill, outline=outline_color, width=2)
+                    layer.sprite(("value", i), "text", (cx, cy), z=1,
+                                 text=val, fill="#000000", font=("Helvetica", 12, "bold"))
 
                 for i in range(len(centers) - 1):
                     x1, y1 = centers[i]
                     x2, y2 = centers[i+1]
-                    canvas.create_line(x1 + node_d // 2, y1, x2 - node_d // 2, y2,
-                                       arrow=tk.LAST, width=2, fill=self.arrow_color)
+                    layer.sprite(("next", i), "line", (x1 + node_d // 2, y1, x2 - node_d // 2, y2), z=2,
+                                 arrow=tk.LAST, width=2, fill=self.arrow_color)
 
                 if self.list_type == "Doubly Linked List" and len(centers) > 1:
                     for i in range(len(centers) - 1):
                         x1, y1 = centers[i]
                         x2, y2 = centers[i + 1]
-                        canvas.create_line(x2 - node_d // 2, y2 + 12, x1 + node_d // 2, y1 + 12,
-                                           arrow=tk.LAST, dash=(4, 3), width=2, fill=self.arrow_color)
+                        layer.sprite(("prev", i), "line", (x2 - node_d // 2, y2 + 12, x1 + node_d // 2, y1 + 12), z=2,
+                                     arrow=tk.LAST, dash=(4, 3), width=2, fill=self.arrow_color)
 
                 if self.list_type == "Circular Linked List" and len(centers) > 1:
                     x_first, y_first = centers[0]
                     x_last, y_last = centers[-1]
                     top = y - 80
-                    canvas.create_line(x_last + node_d // 2, y_last,
-                                       x_last + node_d // 2 + 20, top,
-                                       x_first - node_d // 2 - 20, top,
-                                       x_first - node_d // 2, y_first,
-                                       smooth=True, width=2, arrow=tk.LAST, dash=(4, 3), fill=self.arrow_color)
-                    canvas.create_text((x_first + x_last) / 2, top - 12,
-                                       text="(back to head)", fill="#000000", font=("Helvetica", 10, "italic"))
+                    layer.sprite("back", "line", (x_last + node_d // 2, y_last,
+                                                  x_last + node_d // 2 + 20, top,
+                                                  x_first - node_d // 2 - 20, top,
+                                                  x_first - node_d // 2, y_first), z=2,
+                                 smooth=True, width=2, arrow=tk.LAST, dash=(4, 3), fill=self.arrow_color)
+                    layer.sprite("back_label", "text", ((x_first + x_last) / 2, top - 12), z=3,
+                                 text="(back to head)", fill="#000000", font=("Helvetica", 10, "italic"))
 
                 if centers:
                     hx, hy = centers[0]
-                    canvas.create_text(hx, hy - node_d // 2 - 10, text="HEAD", fill="#000000", font=("Helvetica", 9, "bold"))
+                    layer.sprite("head", "text", (hx, hy - node_d // 2 - 10), z=3,
+                                 text="HEAD", fill="#000000", font=("Helvetica", 9, "bold"))
                     tx, ty = centers[-1]
-                    canvas.create_text(tx, ty + node_d // 2 + 12, text="TAIL", fill="#000000", font=("Helvetica", 9, "bold"))
+                    layer.sprite("tail", "text", (tx, ty + node_d // 2 + 12), z=3,
+                                 text="TAIL", fill="#000000", font=("Helvetica", 9, "bold"))
             except Exception:
                 pass
+        layer.end()
 
         try:
             bbox = canvas.bbox("all")
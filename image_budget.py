@@ -0,0 +1,148 @@
+import atexit
+import os
+import threading
+from collections import OrderedDict
+
+import settings
+
+# Total bytes of decoded image data the app may keep around. Set
+# VISUALIZER_IMAGE_BUDGET_MB to change it (0 disables eviction) and
+# VISUALIZER_IMAGE_DEBUG=1 to print the usage table on exit.
+DEFAULT_BUDGET = int(settings.number("VISUALIZER_IMAGE_BUDGET_MB", 192) * 1024 * 1024)
+
+
+def photo_bytes(photo):
+    try:
+        return photo.width() * photo.height() * 4
+    except Exception:
+        return 0
+
+
+def pil_bytes(img):
+    try:
+        return img.width * img.height * len(img.getbands())
+    except Exception:
+        return 0
+
+
+class ImageEntry:
+    def __init__(self, registry, owner, source, evict):
+        self.registry = registry
+        self.owner = owner
+        self.source = source
+        self.evict = evict
+        self.nbytes = 0
+        self.frames = 0
+
+    def update(self, nbytes, frames=None):
+        self.registry.update(self, nbytes, frames)
+
+    def add(self, nbytes, frames=1):
+        self.registry.update(self, self.nbytes + nbytes, self.frames + frames)
+
+    def touch(self):
+        self.registry.touch(self)
+
+    def release(self):
+        self.registry.release(self)
+
+
+class ImageRegistry:
+    """Accounts for every set of decoded frames the app holds.
+
+    Holders register once, report their size as it changes and touch the
+    entry whenever one of its frames is shown. When the total goes over
+    the budget the least recently shown sets are asked to drop their
+    frames through their ``evict`` callback.
+    """
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        self.budget = budget
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    def register(self, owner, source, evict=None):
+        entry = ImageEntry(self, owner, source, evict)
+        with self._lock:
+            self._entries[id(entry)] = entry
+        return entry
+
+    def update(self, entry, nbytes, frames=None):
+        with self._lock:
+            if id(entry) not in self._entries:
+                return
+            entry.nbytes = max(0, nbytes)
+            if frames is not None:
+                entry.frames = frames
+            self._entries.move_to_end(id(entry))
+        self._enforce(keep=entry)
+
+    def touch(self, entry):
+        with self._lock:
+            if id(entry) in self._entries:
+                self._entries.move_to_end(id(entry))
+
+    def release(self, entry):
+        with self._lock:
+            self._entries.pop(id(entry), None)
+
+    def total(self):
+        with self._lock:
+            return sum(e.nbytes for e in self._entries.values())
+
+    def _enforce(self, keep=None):
+        if not self.budget:
+            return
+        with self._lock:
+            victims = []
+            total = sum(e.nbytes for e in self._entries.values())
+            for entry in self._entries.values():
+                if total <= self.budget:
+                    break
+                if entry is keep or not entry.nbytes or entry.evict is None:
+                    continue
+                victims.append(entry)
+                total -= entry.nbytes
+        # Callbacks run outside the lock; they usually call update()/release()
+        for entry in victims:
+            self.evictions += 1
+            before = entry.nbytes
+            try:
+                entry.evict()
+            except Exception as e:
+                print(f"Image budget: evicting {entry.owner} ({entry.source}) failed: {e}")
+            with self._lock:
+                # Holders that did not report their new size are assumed empty
+                if id(entry) in self._entries and entry.nbytes == before:
+                    entry.nbytes = 0
+                    entry.frames = 0
+
+    def usage(self):
+        """Bytes per source, most recently shown last"""
+        with self._lock:
+            return [(e.owner, e.source, e.frames, e.nbytes) for e in self._entries.values()]
+
+    def dump(self):
+        rows = self.usage()
+        lines = [f"Image memory: {self.total() / 1048576:.1f} MB of "
+                 f"{self.budget / 1048576:.0f} MB budget, {self.evictions} eviction(s)"]
+        for owner, source, frames, nbytes in rows:
+            name = os.path.basename(str(source)) if source else "-"
+            lines.append(f"  {nbytes / 1048576:8.2f} MB  {frames:4d} frame(s)  {owner:<28} {name}")
+        return "\n".join(lines)
+
+
+registry = ImageRegistry()
+
+
+def register(owner, source, evict=None):
+    return registry.register(owner, source, evict)
+
+
+def dump():
+    return registry.dump()
+
+
+if os.environ.get("VISUALIZER_IMAGE_DEBUG"):
+    atexit.register(lambda: print(registry.dump()))
@@ -1,13 +1,20 @@
+import sys
+
+import profiler
+if __name__ == "__main__":
+    profiler.configure(sys.argv)
+
 import tkinter as tk
 from tkinter import ttk, messagebox
-from itertools import count
+import importlib
 import os
+import time
+from functools import partial
 
-try:
-    import pygame
-    HAS_PYGAME = True
-except ImportError:
-    HAS_PYGAME = False
+import audio_service
+
+HAS_PYGAME = audio_service.HAS_PYGAME
+if not HAS_PYGAME:
     print("Warning: 'pygame' library not found. Music will not be played.")
     print("Please install it by running: pip install pygame")
 
@@ -18,78 +25,45 @@ try:
 except ImportError:
     HAS_PIL = False
 
-class AnimatedGIF(tk.Label):
-    def __init__(self, master, path, delay=100, bg="black", target_size=None):
-        super().__init__(master, bg=bg)
-        self.master = master
-        self.delay = delay
-        self.frames = []
-        self.target_size = target_size
-        
-        if not path:
-            return
-            
-        if HAS_PIL:
-            try:
-                pil_img = Image.open(path)
-                from PIL import ImageSequence
-                for pil_frame in ImageSequence.Iterator(pil_img):
-                    try:
-                        frame_copy = pil_frame.copy()
-                        try:
-                            frame_conv = frame_copy.convert('RGBA')
-                        except Exception:
-                            frame_conv = frame_copy.convert('RGB')
-                        if self.target_size is not None:
-                            try:
-                                frame_conv = frame_conv.resize(self.target_size, Image.LANCZOS)
-                            except Exception:
-                                pass
-                        tk_frame = ImageTk.PhotoImage(frame_conv)
-                        self.frames.append(tk_frame)
-                    except Exception:
-                        continue
-            except Exception:
-                self.frames = []
+from animated_gif import AnimatedGIF
+import settings
+from warmup import Warmup
+from window_pool import WindowPool
 
-        if not self.frames:
-            try:
-                for i in count(0):
-                    frame = tk.PhotoImage(file=path, format=f"gif -index {i}")
-                    self.frames.append(frame)
-            except tk.TclError:
-                pass
+# The splash closes as soon as warm-up finishes; set this to keep it up
+# for at least that many milliseconds.
+SPLASH_MIN_MS = settings.number("VISUALIZER_SPLASH_MIN_MS", 0, int)
 
-        if not self.frames:
-            try:
-                img = tk.PhotoImage(file=path)
-                self.frames.append(img)
-            except tk.TclError:
-                self.frames = []
-
-        if self.frames:
-            self.index = 0
-            self._current_image = self.frames[0]
-            self.configure(image=self._current_image)
-            try:
-                print("AnimatedGIF: loaded", len(self.frames), "frames")
-            except Exception:
-                pass
-            if len(self.frames) > 1:
-                self.animate()
+SPLASH_GIF = "blackpink-cheering.gif"
 
-    def animate(self):
-        if not self.frames:
-            return
-        self.index = (self.index + 1) % len(self.frames)
-        self._current_image = self.frames[self.index]
-        self.configure(image=self._current_image)
-        self.after(self.delay, self.animate)
+# Sizes the menu header and credits images are shown at (also used by asset_bundle)
+HEADER_IMAGE_SIZE = (460, 210)
+CREDITS_IMAGE_SIZE = (400, 400)
+
+
+def splash_layout(gif_size, screen_size):
+    """(window size, GIF target size) of the splash for a GIF of ``gif_size``"""
+    gw, gh = gif_size
+    progress_height = 40
+    max_h = int(screen_size[1] * 0.5)
+    target_h = min(gh + progress_height + 40, max_h)
+    scale = target_h / (gh + progress_height + 40) if (gh + progress_height + 40) > 0 else 1
+    target_w = max(int(gw * scale), 200)
+
+    if target_w < 300: target_w = 300
+    if target_h < 250: target_h = 250
+
+    avail_h = target_h - progress_height - 20
+    scale = avail_h / gh if gh else 1.0
+    return (target_w, target_h), (max(1, int(gw * scale)), max(1, int(gh * scale)))
 
 
 class SplashScreen(tk.Toplevel):
-    def __init__(self, parent, bg_path=None, gif_path=None):
+    def __init__(self, parent, bg_path=None, gif_path=None, warmup=None, min_display_ms=0):
         super().__init__(parent)
+        self.warmup = warmup
+        self.min_display_ms = min_display_ms
+        self._shown_at = time.monotonic()
         self.title("Starting up...")
         self.geometry("500x450")
         self.configure(bg="black")
@@ -136,23 +110,13 @@ class SplashScreen(tk.Toplevel):
              self.progress = ttk.Progressbar(self, orient="horizontal", length=350, mode="determinate")
              self.progress.place(relx=0.5, rely=0.5, anchor="center")
              if self._fade: self.fade_in()
-             self.loading_bar()
+             self.run_warmup()
              return
 
+        target_size = None
         if gif_size:
-            gw, gh = gif_size
-            progress_height = 40
-            max_w = int(self.winfo_screenwidth() * 0.5)
-            max_h = int(self.winfo_screenheight() * 0.5)
-            target_h = min(gh + progress_height + 40, max_h) 
-            scale = target_h / (gh + progress_height + 40) if (gh + progress_height + 40) > 0 else 1
-            target_w = max(int(gw * scale), 200)
-            
-            if target_w < 300: target_w = 300
-            if target_h < 250: target_h = 250
-            
-            w, h = target_w, target_h
             sw, sh = self.winfo_screenwidth(), self.winfo_screenheight()
+            (w, h), target_size = splash_layout(gif_size, (sw, sh))
             x, y = (sw // 2) - (w // 2), (sh // 2) - (h // 2)
             self.geometry(f"{w}x{h}+{x}+{y}")
         else:
@@ -162,19 +126,6 @@ class SplashScreen(tk.Toplevel):
         self.target_image_y = 0.45
 
         if gif_path:
-            target_size = None
-            try:
-                if gif_size:
-                    gw, gh = gif_size
-                    progress_height = 40
-                    avail_h = h - progress_height - 20
-                    scale = avail_h / gh if gh else 1.0
-                    target_w = max(1, int(gw * scale))
-                    target_h = max(1, int(gh * scale))
-                    target_size = (target_w, target_h)
-            except Exception:
-                target_size = None
-            
             self.gif = AnimatedGIF(self, gif_path, delay=80, bg="black", target_size=target_size)
             
             self.gif.place(relx=0.5, rely=self.current_image_y, anchor="center")
@@ -186,7 +137,33 @@ class SplashScreen(tk.Toplevel):
 
         if self._fade:
             self.fade_in()
-        self.loading_bar()
+        else:
+            self.fade_in_image()
+        self.run_warmup()
+
+    def fade_in_image(self):
+        # No window alpha on this platform: crossfade the GIF in from black
+        # while it slides into place instead.
+        gif = self.gif
+        self.animate_image_slide_in()
+        if not HAS_PIL or gif._current_image is None:
+            return
+        from crossfade import Crossfade
+        try:
+            end = ImageTk.getimage(gif._current_image)
+            start = Image.new(end.mode, end.size, "black")
+        except Exception:
+            return
+        if gif.loop is not None:
+            gif.loop.stop()
+
+        def resume_gif():
+            gif.configure(image=gif._current_image)
+            if gif.loop is not None:
+                gif.loop.start(gif.clock.start(gif.index))
+
+        self._crossfade = Crossfade(gif, start, end, steps=20, interval=50, on_done=resume_gif)
+        self._crossfade.start()
 
     def fade_in(self):
         alpha = self.attributes("-alpha")
@@ -213,31 +190,37 @@ class SplashScreen(tk.Toplevel):
         
         self.after(15, self.animate_image_slide_in)
 
-    def loading_bar(self):
-        val = self.progress["value"]
-        if val < 100:
-            self.progress["value"] = val + 2
-            self.after(50, self.loading_bar)
-        else:
-            self.after(500, self.destroy)
+    def run_warmup(self):
+        if self.warmup is None:
+            self._warmup_done()
+            return
+        self.warmup.start(self, on_progress=self._set_progress, on_done=self._warmup_done)
 
-try:
-    from gui_blkpnk import LinkedListGUI
-except ImportError:
-    messagebox.showerror("Import Error", "Could not import LinkedListGUI from gui_blkpnk.py.")
-    exit()
-    
-try:
-    from tk_with_pics import AsciiStackApp
-except ImportError:
-    messagebox.showerror("Import Error", "Could not import AsciiStackApp from tk_with_pics.py.")
-    exit()
+    def _set_progress(self, fraction):
+        self.progress["value"] = fraction * 100
 
-try:
-    from recursion1clone import RecursionGUI, create_splash_screen as create_recursion_splash
-except ImportError:
-    messagebox.showerror("Import Error", "Could not import from recursion1clone.py.")
-    exit()
+    def _warmup_done(self):
+        self.progress["value"] = 100
+        elapsed_ms = (time.monotonic() - self._shown_at) * 1000
+        self.after(max(0, int(self.min_display_ms - elapsed_ms)), self.destroy)
+
+# Visualizer modules (and the PIL work they do on import) are only
+# loaded when their menu button is clicked or a warm-up task asks for them.
+VISUALIZERS = {
+    "linked_list": ("gui_blkpnk", "LinkedListGUI"),
+    "stack": ("tk_with_pics", "AsciiStackApp"),
+    "recursion": ("recursion1clone", "RecursionGUI"),
+}
+
+
+def import_visualizer(key):
+    """Import the module behind a menu entry; safe to call from a worker thread"""
+    module_name, _ = VISUALIZERS[key]
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    # import_module bypasses the profiler's __import__ hook, so time it here
+    with profiler.span(f"import {module_name}", "import"):
+        return importlib.import_module(module_name)
 
 
 class AppMenu:
@@ -264,18 +247,8 @@ class AppMenu:
             
         self.music_file = "Kill this love but lofi BLACKPINK lofi mix  chillhop beats to study_relax to.mp3"
         self.music_path = None
-        global HAS_PYGAME
-        
-        if HAS_PYGAME:
-            try:
-                pygame.mixer.init()
-                self.music_path = os.path.join(script_dir, self.music_file)
-                if not os.path.exists(self.music_path):
-                    print(f"Warning: Music file not found: {self.music_path}")
-                    self.music_path = None
-            except Exception as e:
-                print(f"Error initializing pygame.mixer: {e}")
-                HAS_PYGAME = False
+        self.windows = WindowPool(self.root)
+        self.background_warmup = None
         
         self.style = ttk.Style()
         self.style.theme_use('default')
@@ -329,8 +302,6 @@ class AppMenu:
         self.main_frame = tk.Frame(self.root, bg=self.BG_COLOR)
         self.main_frame.pack(expand=True, fill="both")
 
-        self.create_main_menu()
-
     def center_window(self, width, height):
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
@@ -344,7 +315,7 @@ class AppMenu:
         
         self.main_frame.pack_configure(padx=40, pady=40)
 
-        target_size = (460, 210) 
+        target_size = HEADER_IMAGE_SIZE
         
         self.header_image = AnimatedGIF(
             self.main_frame, 
@@ -378,84 +349,143 @@ class AppMenu:
                    command=self.show_credits_window
                    ).pack(pady=10)
 
-    def open_app_window(self, app_class, title):
+    def init_music(self):
+        global HAS_PYGAME
+        if not audio_service.init_mixer():
+            HAS_PYGAME = False
+            return
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        self.music_path = os.path.join(script_dir, self.music_file)
+        if not os.path.exists(self.music_path):
+            print(f"Warning: Music file not found: {self.music_path}")
+            self.music_path = None
+        else:
+            audio_service.preload_now(self.music_path)
+
+    def build_warmup(self):
+        """Startup work the splash waits for: only what the main menu shows"""
+        import frame_cache
+        warmup = Warmup()
+        warmup.add("music", self.init_music)
+        if self.splash_image_path:
+            warmup.add(f"image {os.path.basename(self.splash_image_path)}",
+                       partial(frame_cache.warm, self.splash_image_path, HEADER_IMAGE_SIZE, None))
+        return warmup
+
+    def build_background_warmup(self):
+        """Work that only speeds up later clicks; runs once the menu is up"""
+        import frame_cache
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        warmup = Warmup(workers=1)
+        for key, (module_name, _) in VISUALIZERS.items():
+            warmup.add(f"import {module_name}", partial(import_visualizer, key), weight=2)
+        credits_image = os.path.join(script_dir, "group67.png")
+        if os.path.exists(credits_image):
+            warmup.add("image group67.png", partial(frame_cache.warm, credits_image, CREDITS_IMAGE_SIZE, None))
+        warmup.add("stack assets", self._warm_stack_assets, weight=2)
+        return warmup
+
+    def _warm_stack_assets(self):
+        import frame_cache
+        stack = import_visualizer("stack")
+        for path in stack.popup_images():
+            frame_cache.warm(path, stack.POPUP_MAX_SIZE, "fit")
+        return stack.preload_sounds()
+
+    def load_visualizer(self, key):
+        """Return the visualizer module for ``key``, or None after reporting the error"""
+        module_name, class_name = VISUALIZERS[key]
+        try:
+            return import_visualizer(key)
+        except Exception as e:
+            messagebox.showerror("Import Error",
+                                 f"Could not import {class_name} from {module_name}.py.\n\n{e}",
+                                 parent=self.root)
+            return None
+
+    def reopen_app_window(self, key, title, clicked=None):
+        """Show the kept, hidden window for ``key`` again; False if there is none"""
+        app_window = self.windows.take(key)
+        if app_window is None:
+            return False
+        self.root.withdraw()
+        profiler.on_first_paint(app_window, f"reopen {title}", clicked, "interaction")
+        app_window.deiconify()
+        app_window.lift()
+        return True
+
+    def open_app_window(self, app_class, title, clicked=None, key=None):
         self.root.withdraw()
         app_window = tk.Toplevel(self.root)
         app_window.title(title)
+        profiler.on_first_paint(app_window, f"open {title}", clicked, "interaction")
         
-        app_instance = app_class(app_window)
+        with profiler.span(f"build {app_class.__name__}", "interaction"):
+            app_window.app_instance = app_class(app_window)
         app_window.protocol("WM_DELETE_WINDOW",
-                            lambda: self.close_app_window(app_window))
+                            lambda: self.close_app_window(app_window, key))
 
     def open_linked_list_gui(self):
-        self.open_app_window(LinkedListGUI, "Linked List Visualizer")
-
-    def close_app_window(self, app_window):
-        app_window.destroy()
+        clicked = profiler.now()
+        if self.reopen_app_window("linked_list", "Linked List Visualizer", clicked):
+            return
+        module = self.load_visualizer("linked_list")
+        if module is not None:
+            self.open_app_window(module.LinkedListGUI, "Linked List Visualizer", clicked, "linked_list")
+
+    def close_app_window(self, app_window, key=None):
+        # Finished sub-apps are kept hidden for a quick reopen when allowed
+        ready = getattr(app_window, "app_instance", None) is not None
+        if not (key and ready and self.windows.release(key, app_window)):
+            app_window.destroy()
         self.root.deiconify()
         self.root.lift()
 
     def open_stack_gui(self):
-        self.open_app_window(AsciiStackApp, "Stack Visualizer")
+        clicked = profiler.now()
+        if self.reopen_app_window("stack", "Stack Visualizer", clicked):
+            return
+        module = self.load_visualizer("stack")
+        if module is not None:
+            self.open_app_window(module.AsciiStackApp, "Stack Visualizer", clicked, "stack")
 
     def open_recursion_gui(self):
+        clicked = profiler.now()
+        if self.reopen_app_window("recursion", "Recursion Visualizer", clicked):
+            return
+        recursion = self.load_visualizer("recursion")
+        if recursion is None:
+            return
         self.root.withdraw()
         app_window = tk.Toplevel(self.root)
         app_window.withdraw()
         
-        splash = create_recursion_splash(app_window)
+        profiler.on_first_paint(app_window, "open Recursion Visualizer", clicked, "interaction")
         
-        def launch_app():
+        def launch_app(splash):
             splash.destroy()
-            app_instance = RecursionGUI(app_window) 
+            with profiler.span("build RecursionGUI", "interaction"):
+                app_window.app_instance = recursion.RecursionGUI(app_window) 
             app_window.deiconify()
         
         app_window.protocol("WM_DELETE_WINDOW",
-                            lambda: self.close_app_window(app_window))
+                            lambda: self.close_app_window(app_window, "recursion"))
         
-        app_window.after(3000, launch_app)
+        recursion.launch_with_splash(app_window, launch_app)
 
     def quit_app(self):
-        global HAS_PYGAME
-        if HAS_PYGAME:
-            try:
-                pygame.mixer.music.stop()
-                pygame.mixer.music.unload()
-                pygame.mixer.quit()
-            except Exception as e:
-                print(f"Error stopping pygame: {e}")
+        if self.background_warmup is not None:
+            self.background_warmup.cancel()
+        self.windows.clear()
+        audio_service.shutdown()
         self.root.quit()
 
-    def fade_in_image(self, window, alpha):
-        try:
-            if alpha > 1.0:
-                self._final_credits_img = ImageTk.PhotoImage(self._credits_pil_img)
-                self.credits_image_label.config(image=self._final_credits_img)
-                self.credits_image_label.image = self._final_credits_img
-                return
-
-            blended_img = Image.blend(self._credits_bg_img, self._credits_pil_img, alpha)
-            
-            self._tk_frame = ImageTk.PhotoImage(blended_img)
-            
-            self.credits_image_label.config(image=self._tk_frame)
-            self.credits_image_label.image = self._tk_frame
-            
-            new_alpha = alpha + 0.04 
-            window.after(40, lambda: self.fade_in_image(window, new_alpha))
-        
-        except Exception as e:
-            try:
-                self._final_credits_img = ImageTk.PhotoImage(self._credits_pil_img)
-                self.credits_image_label.config(image=self._final_credits_img)
-                self.credits_image_label.image = self._final_credits_img
-            except Exception:
-                pass
-
     def show_credits_window(self):
+        clicked = profiler.now()
         self.root.withdraw()
 
         credits_window = tk.Toplevel(self.root)
+        profiler.on_first_paint(credits_window, "open Credits", clicked, "interaction")
         credits_window.title("Developers")
         credits_window.config(bg=self.BG_COLOR)
         credits_window.resizable(False, False)
@@ -472,33 +502,38 @@ class AppMenu:
 
         global HAS_PYGAME
         if HAS_PYGAME and self.music_path:
-            try:
-                pygame.mixer.music.load(self.music_path)
-                pygame.mixer.music.play(loops=-1)
-            except Exception as e:
-                print(f"Error playing music: {e}")
+            audio_service.play(self.music_path, loops=-1)
 
         script_dir = os.path.dirname(os.path.abspath(__file__))
         
         dev_image_path = os.path.join(script_dir, "group67.png") 
 
-        target_size = (400, 400)
+        target_size = CREDITS_IMAGE_SIZE
+        import asset_bundle
+        dev_image_path = asset_bundle.resolve_image(dev_image_path, target_size)
         
         global HAS_PIL
         if os.path.exists(dev_image_path) and HAS_PIL:
             try:
-                self._credits_pil_img = Image.open(dev_image_path).resize(target_size, Image.LANCZOS).convert('RGB')
+                from crossfade import Crossfade
+                import resampling
+                raw, src_size = resampling.open_image(dev_image_path, target_size, draft=True)
+                self._credits_pil_img = resampling.prepare_frame(
+                    raw, target_size, resample=resampling.DRAFT_FILTER, src_size=src_size).convert('RGB')
                 self._credits_bg_img = Image.new('RGB', target_size, self.BG_COLOR)
                 
                 self.credits_image_label = tk.Label(credits_window, bg=self.BG_COLOR)
-                
-                self._tk_frame = ImageTk.PhotoImage(self._credits_bg_img)
-                self.credits_image_label.config(image=self._tk_frame)
-                self.credits_image_label.image = self._tk_frame
-                
                 self.credits_image_label.pack(pady=(20, 10))
                 
-                self.fade_in_image(credits_window, 0.0)
+                self._credits_fade = Crossfade(self.credits_image_label, self._credits_bg_img,
+                                               self._credits_pil_img, steps=25, interval=40)
+                self._credits_fade.start()
+
+                reopen = dev_image_path if raw.size != src_size else None
+                self._credits_refiner = resampling.Refiner(self.credits_image_label)
+                self._credits_refiner.submit(
+                    resampling.refine_job(raw, target_size, reopen_path=reopen),
+                    lambda img: self._credits_fade.set_end_image(img.convert('RGB')))
                 
             except Exception as e:
                 print(f"Error starting fade-in animation: {e}. Falling back.")
@@ -526,7 +561,7 @@ class AppMenu:
     def start_with_splash(self):
         script_dir = os.path.dirname(os.path.abspath(__file__))
         
-        splash_gif_name = "blackpink-cheering.gif"
+        splash_gif_name = SPLASH_GIF
         splash_gif_path = os.path.join(script_dir, splash_gif_name)
         gif_path = None
         
@@ -538,14 +573,22 @@ class AppMenu:
             if os.path.exists(fallback_image):
                 gif_path = fallback_image
         
-        splash = SplashScreen(self.root, bg_path=None, gif_path=gif_path)
+        splash = SplashScreen(self.root, bg_path=None, gif_path=gif_path,
+                              warmup=self.build_warmup(), min_display_ms=SPLASH_MIN_MS)
+        profiler.on_first_paint(splash, "splash first paint", profiler.START, "startup")
         self.root.wait_window(splash)
         
+        profiler.on_first_paint(self.root, "menu first paint", profiler.START, "startup")
+        with profiler.span("build main menu", "startup"):
+            self.create_main_menu()
         self.root.deiconify()
+        self.background_warmup = self.build_background_warmup()
+        self.background_warmup.start(self.root)
 
 
 if __name__ == "__main__":
-    root = tk.Tk()
+    with profiler.span("Tk root", "startup"):
+        root = tk.Tk()
     root.withdraw()
 
     app = AppMenu(root)
@@ -0,0 +1,206 @@
+"""Opt-in startup/interaction profiler.
+
+Enable with ``VISUALIZER_PROFILE=1`` (or a path) or ``python main.py
+--profile[=path]``. Module imports, Tk root creation, first paints, asset
+decodes, mixer init and menu-click-to-window latency are collected and
+written on exit as a Chrome trace JSON (open it in chrome://tracing or
+ui.perfetto.dev); a per-name summary is included. Add ``--cprofile`` or
+``VISUALIZER_CPROFILE=1`` to also dump a cProfile of the Tk thread next
+to it. When disabled every call here is a cheap no-op.
+"""
+import atexit
+import builtins
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_PATH = "profile.json"
+
+enabled = False
+output_path = None
+START = time.perf_counter()
+_events = []
+_threads = {}
+_lock = threading.Lock()
+_cprofile = None
+_original_import = None
+
+
+def now():
+    return time.perf_counter()
+
+
+def _us(t):
+    return round((t - START) * 1e6, 1)
+
+
+def record(name, start, end=None, cat="app", **args):
+    """Add a completed span (or an instant when ``end`` is None)"""
+    if not enabled:
+        return
+    thread = threading.current_thread()
+    event = {"name": name, "cat": cat, "ts": _us(start), "pid": os.getpid(), "tid": thread.ident}
+    if end is None:
+        event["ph"] = "i"
+        event["s"] = "t"
+    else:
+        event["ph"] = "X"
+        event["dur"] = round((end - start) * 1e6, 1)
+    if args:
+        event["args"] = args
+    with _lock:
+        _threads.setdefault(thread.ident, thread.name)
+        _events.append(event)
+
+
+def mark(name, cat="app", **args):
+    record(name, now(), None, cat, **args)
+
+
+@contextmanager
+def _span(name, cat, args):
+    start = now()
+    try:
+        yield
+    finally:
+        record(name, start, now(), cat, **args)
+
+
+@contextmanager
+def _null_span():
+    yield
+
+
+def span(name, cat="app", **args):
+    """``with profiler.span("decode x.gif", "asset"):`` times the block"""
+    if not enabled:
+        return _null_span()
+    return _span(name, cat, args)
+
+
+def on_first_paint(widget, name, start=None, cat="paint"):
+    """Record the time from ``start`` (default: now) until ``widget`` first exposes"""
+    if not enabled:
+        return
+    start = now() if start is None else start
+    done = []
+    funcid = []
+
+    def exposed(event=None):
+        if not done:
+            done.append(True)
+            record(name, start, now(), cat)
+            # Removed once fired so windows measured on every reopen do not
+            # collect one handler per open
+            if funcid:
+                widget.after_idle(unbind, widget, "<Expose>", funcid[0])
+
+    try:
+        funcid.append(widget.bind("<Expose>", exposed, add="+"))
+    except Exception:
+        pass
+
+
+def unbind(widget, sequence, funcid):
+    """Remove only the binding ``funcid`` from ``sequence`` on ``widget``"""
+    # Misc.unbind(seq, funcid) drops every binding on the sequence before
+    # Python 3.13, so strip just this command from the binding script
+    try:
+        script = widget.bind(sequence)
+        kept = [line for line in script.split("\n") if funcid not in line]
+        widget.bind(sequence, "\n".join(kept))
+        widget.deletecommand(funcid)
+    except Exception:
+        pass
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if level or name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+    start = now()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        record(f"import {name}", start, now(), "import")
+
+
+def summary():
+    totals = {}
+    with _lock:
+        events = list(_events)
+    for e in events:
+        if e["ph"] != "X":
+            continue
+        entry = totals.setdefault(e["name"], {"cat": e["cat"], "count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        ms = e["dur"] / 1000
+        entry["count"] += 1
+        entry["total_ms"] = round(entry["total_ms"] + ms, 3)
+        entry["max_ms"] = round(max(entry["max_ms"], ms), 3)
+    return dict(sorted(totals.items(), key=lambda kv: -kv[1]["total_ms"]))
+
+
+def write(path=None):
+    path = path or output_path
+    with _lock:
+        events = list(_events)
+        events += [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+                   for tid, name in _threads.items()]
+    data = {"traceEvents": events, "displayTimeUnit": "ms", "summary": summary()}
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        print(f"Profile written to {path} ({len(events)} events)")
+    except OSError as e:
+        print(f"Profiler: could not write {path}: {e}")
+    if _cprofile is not None:
+        _cprofile.disable()
+        prof_path = os.path.splitext(path)[0] + ".prof"
+        try:
+            _cprofile.dump_stats(prof_path)
+            print(f"cProfile stats written to {prof_path}")
+        except OSError as e:
+            print(f"Profiler: could not write {prof_path}: {e}")
+
+
+def start(path=DEFAULT_PATH, use_cprofile=False):
+    global enabled, output_path, _cprofile, _original_import
+    if enabled:
+        return
+    enabled = True
+    output_path = path
+    mark("profiler start", "process")
+    _original_import = builtins.__import__
+    builtins.__import__ = _timed_import
+    if use_cprofile:
+        import cProfile
+        _cprofile = cProfile.Profile()
+        _cprofile.enable()
+    atexit.register(write)
+
+
+def configure(argv=None):
+    """Start profiling if requested by ``--profile[=path]``/``--cprofile`` or the env vars.
+
+    The flags are removed from ``argv`` so the app never sees them.
+    """
+    argv = sys.argv if argv is None else argv
+    path = os.environ.get("VISUALIZER_PROFILE", "").strip()
+    if path.lower() in ("", "0", "false", "no", "off"):
+        path = None
+    elif path.lower() in ("1", "true", "yes", "on"):
+        path = DEFAULT_PATH
+    use_cprofile = os.environ.get("VISUALIZER_CPROFILE", "") not in ("", "0")
+    for arg in list(argv[1:]):
+        if arg == "--profile" or arg.startswith("--profile="):
+            path = arg.partition("=")[2] or DEFAULT_PATH
+            argv.remove(arg)
+        elif arg == "--cprofile":
+            use_cprofile = True
+            path = path or DEFAULT_PATH
+            argv.remove(arg)
+    if path:
+        start(path, use_cprofile)
+    return enabled
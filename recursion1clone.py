@@ -1,36 +1,40 @@
+import os
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from functools import partial
-import random
-from PIL import Image, ImageTk
-import pygame
- 
-class RecursionDemo:
-    def __init__(self):
-        self.MONTHS = [
-            "January", "February", "March", "April", "May", "June",
-            "July", "August", "September", "October", "November", "December"
-        ]
-
-    def head_recursion_attendance(self, students, idx=0, present=None, trace=None):
-        if present is None:
-            present = []
-        if trace is None:
-            trace = []
-        if idx == 0:
-            students = [name.strip().title() for name in students]
-
-        if idx >= len(students):
-            trace.append("Last student reached. Now reporting back.")
-            return present, trace
-
-        present, trace = self.head_recursion_attendance(students, idx + 1, present, trace)
-        name = students[idx]
-        trace.append(f"{name} says: Present!")
-        present.append(name)
-        return present, trace
+from animated_gif import AnimationLoop, FrameClock
+import audio_service
+from core import debt, roster
+from core.recursion import RecursionDemo, parse_list
+import frame_cache
+import image_budget
+from resampling import Refiner
+from sprites import Sprite
+from typewriter import Typewriter
+from warmup import Warmup
+
+SLOT_IMAGES = (r"yakuzamafia.jpg", r"scp-067-67.gif")
+RESULT_GIFS = (r"win.gif", r"lose.gif")
+# Sizes the slot images and result GIFs are prepared at (also used by asset_bundle)
+SLOT_SIZE = (180, 180)
+RESULT_SIZE = (400, 400)
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def asset_path(name):
+    """``name`` next to this script, so assets load whatever the working directory"""
+    return os.path.join(HERE, name)
 
+ 
 class RecursionGUI:
+    DEBT_TRACKS = (
+        "Cha-Ching Sound Effect.mp3",
+        "Impact Laser - Free Sound Effect-[AudioTrimmer.com].mp3",
+        "Persona 4 - Specialist.mp3",
+        "Yakuza OST - Baka Mitai - Kiryu full versionJapanese Romaji English lyrics.mp3",
+    )
+
     def __init__(self, root):
         self.root = root
         self.root.title("Recursion Visualizer - Mafia Debt Game & Attendance")
@@ -38,17 +42,27 @@ class RecursionGUI:
         self.root.configure(bg="#ffc0cb")
 
         self.demo = RecursionDemo()
-        self.animation_after_id = None
+        self.typewriter = None
+        self.last_output = None
+        self.roster_import = None
+        self.roster_import_after_id = None
         self.debt_game_state = None
         self.debt_game_after_id = None
         self.gif_frames = []
-        self.gif_animation_after_id = None
+        self.gif_clock = None
+        self.gif_loop = None
+        self.slot_cache = {}
+        self.slot_path = None
         self.result_gif_frames = []
-        self.result_gif_animation_id = None
+        self.result_gif_clock = None
+        self.result_gif_loop = None
+        self.result_gif_memory = None
         self.result_frame = None
         self.image_photo = None
+        self.refiner = Refiner(self.root)
 
-        pygame.mixer.init(frequency=33075)
+        audio_service.init_mixer()
+        audio_service.preload(*self.DEBT_TRACKS)
         self.setup_gui()
 
     def setup_gui(self):
@@ -60,7 +74,7 @@ class RecursionGUI:
                                      bg="#ffc0cb", fg="black", font=("Arial", 12, "bold"), padx=10, pady=6)
         debt_frame.pack(fill="x", padx=20, pady=8)
 
-        slot_size = 180
+        slot_size = SLOT_SIZE[0]
         self.debt_image_slot = tk.Canvas(debt_frame, width=slot_size, height=slot_size,
                                         bg="white", relief="ridge", bd=2, highlightthickness=0)
         self.debt_image_slot.create_text(slot_size//2, slot_size//2,
@@ -68,7 +82,10 @@ class RecursionGUI:
                                          font=("Arial", 10), fill="gray", justify="center", tags=("placeholder",))
         self.debt_image_slot.pack(side="left", padx=10, pady=5)
         self.debt_image = None
-        self.debt_image_id = None
+        self.slot_sprite = Sprite(self.debt_image_slot, "image", (slot_size//2, slot_size//2))
+        self.gif_loop = AnimationLoop(self.debt_image_slot, self._animate_gif,
+                                      on_resume=lambda: self.gif_clock.start(self.gif_clock.index))
+        self.gif_memory = image_budget.register("RecursionGUI.gif_frames", None)
 
         self._load_slot_image(r"yakuzamafia.jpg")
 
@@ -96,6 +113,10 @@ class RecursionGUI:
                                         font=("Arial", 11), bg="#FF6347", fg="white", width=15)
         self.debt_reset_btn.pack(side="left", padx=5)
  
+        self.instant_debt_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(debt_btn_frame, text="Instant result",
+                        variable=self.instant_debt_var).pack(side="left", padx=5)
+ 
         self.debt_progress = ttk.Progressbar(debt_frame, orient="horizontal", length=300, mode="determinate")
         self.debt_progress.pack(pady=5)
         self.debt_progress_label = tk.Label(debt_frame, text="", fg="black", bg="#ffc0cb", font=("Arial", 10))
@@ -116,14 +137,31 @@ class RecursionGUI:
         btn_box_frame.pack(fill="x", pady=4)
         ttk.Button(btn_box_frame, text="Run Attendance (Head Recursion)",
                    command=self.run_head_recursion).pack(side="left", padx=(0, 8))
+        ttk.Button(btn_box_frame, text="Import Roster...",
+                   command=self.import_roster).pack(side="left", padx=(0, 8))
+        self.dedupe_roster_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(btn_box_frame, text="Remove duplicates",
+                        variable=self.dedupe_roster_var).pack(side="left", padx=(0, 8))
         ttk.Button(btn_box_frame, text="Clear Log",
                    command=partial(self.clear_output, reset_game=False)).pack(side="left")
+        ttk.Button(btn_box_frame, text="Skip Typing",
+                   command=self.skip_output).pack(side="left", padx=(8, 0))
+        ttk.Button(btn_box_frame, text="Save Full Trace...",
+                   command=self.save_output).pack(side="left", padx=(8, 0))
+        self.instant_output_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(btn_box_frame, text="Instant", variable=self.instant_output_var,
+                        command=self._on_instant_toggle).pack(side="left", padx=(8, 0))
+        self.roster_status_label = tk.Label(attend_head_frame, text="", font=("Arial", 9),
+                                            fg="black", bg="#ffc0cb", anchor="w")
+        self.roster_status_label.pack(fill="x")
  
         out_frame = tk.Frame(self.root, bg="#ffc0cb")
         out_frame.pack(fill="both", expand=True, padx=20, pady=12)
  
         self.output_text = tk.Text(out_frame, height=18, bg="white", fg="black", font=("Courier", 10))
         self.output_text.pack(side="top", fill="both", expand=True)
+        self.typewriter = Typewriter(self.output_text)
+        self.instant_output_var.set(self.typewriter.instant)
  
         self.image_label = tk.Label(out_frame, bg="white")
         self.image_label.pack(side="bottom", pady=5)
@@ -135,60 +173,54 @@ class RecursionGUI:
         self.reset_debt_game(init=True)
  
     def parse_list(self, raw):
-        items = [s.strip().title() if ',' in raw else s.strip() for s in raw.split(",") if s.strip()]
-        return items
- 
-    def _prepare_lines(self, trace_list):
-        lines = []
-        for item in trace_list:
-            parts = item.split("\n")
-            for p in parts:
-                lines.append(p)
-        return lines
- 
-    def update_output(self, title, trace_list):
-        if self.animation_after_id:
-            try:
-                self.root.after_cancel(self.animation_after_id)
-            except Exception:
-                pass
-            self.animation_after_id = None
+        return parse_list(raw)
+ 
+    def _prepare_lines(self, trace):
+        """Lazily split trace items (strings or TraceEvents) into display lines"""
+        for item in trace:
+            text = getattr(item, "text", item)
+            if text is None:
+                continue
+            yield from text.split("\n")
+ 
+    def update_output(self, title, trace):
+        self.typewriter.cancel()
  
         self.output_text.config(state="normal")
         self.output_text.delete("1.0", tk.END)
-        self.output_text.insert(tk.END, f"{title}\n{'='*60}\n")
-        lines = self._prepare_lines(trace_list)
-        self._animate_lines(lines, 0, 0)
         self.output_text.config(state="disabled")
+        self.typewriter.write(f"{title}\n{'='*60}\n")
+        self.typewriter.start(self._prepare_lines(trace))
  
-    def _animate_lines(self, lines, line_idx, word_idx):
-        self.output_text.config(state="normal")
- 
-        if line_idx >= len(lines):
-            self.animation_after_id = None
-            self.output_text.config(state="disabled")
+    def save_output(self):
+        """Write the whole trace of the last run to a file, including lines trimmed from the view"""
+        if self.last_output is None:
+            messagebox.showinfo("Save Full Trace", "Run the attendance first.")
+            return
+        path = filedialog.asksaveasfilename(parent=self.root, title="Save Full Trace", defaultextension=".txt",
+                                            filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if not path:
             return
+        title, make_trace = self.last_output
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"{title}\n{'='*60}\n")
+                for line in self._prepare_lines(make_trace()):
+                    f.write(line + "\n")
+        except OSError as e:
+            messagebox.showerror("Save Full Trace", f"Could not save the trace:\n{e}")
  
-        line = lines[line_idx]
-        words = line.split(' ') if line != "" else []
-        if word_idx < len(words):
-            prefix = "" if word_idx == 0 else " "
-            self.output_text.insert(tk.END, prefix + words[word_idx])
-            self.animation_after_id = self.root.after(300, lambda: self._animate_lines(lines, line_idx, word_idx + 1))
-        else:
-            self.output_text.insert(tk.END, "\n")
-            self.animation_after_id = self.root.after(300, lambda: self._animate_lines(lines, line_idx + 1, 0))
+    def skip_output(self):
+        self.typewriter.skip()
  
-        self.output_text.see(tk.END)
-        self.output_text.config(state="disabled")
+    def _on_instant_toggle(self):
+        self.typewriter.instant = self.instant_output_var.get()
+        if self.typewriter.instant and self.typewriter.running:
+            self.typewriter.skip()
  
     def clear_output(self, reset_game=True):
-        if self.animation_after_id:
-            try:
-                self.root.after_cancel(self.animation_after_id)
-            except Exception:
-                pass
-            self.animation_after_id = None
+        self.typewriter.cancel()
+        self.last_output = None
  
         self.output_text.config(state="normal")
         self.output_text.delete("1.0", tk.END)
@@ -203,11 +235,7 @@ class RecursionGUI:
         else:
             self._load_slot_image(r"yakuzamafia.jpg")
 
-        try:
-            pygame.mixer.music.load(r"Cha-Ching Sound Effect.mp3")
-            pygame.mixer.music.play()
-        except pygame.error:
-            pass
+        audio_service.play(r"Cha-Ching Sound Effect.mp3")
 
         try:
             payment = int(self.debt_payment_entry.get())
@@ -223,6 +251,12 @@ class RecursionGUI:
         self.debt_game_state["current_month"] = 1
         self.debt_game_state["remaining_debt"] = self.debt_game_state["debt"]
  
+        if self.instant_debt_var.get():
+            state = self.debt_game_state
+            state["remaining_debt"] = debt.final_debt(state["debt"], state["months"], payment)
+            state["current_month"] = state["months"] + 1
+            self.show_debt_result()
+            return
         self.update_debt_progress()
  
     def update_debt_progress(self):
@@ -237,7 +271,7 @@ class RecursionGUI:
         )
         self.root.update_idletasks()
  
-        state["remaining_debt"] -= state["payment"]
+        state["remaining_debt"] = debt.pay_month(state["remaining_debt"], state["payment"])
         state["current_month"] += 1
  
         self.debt_game_after_id = self.root.after(400, self.update_debt_progress)
@@ -248,47 +282,33 @@ class RecursionGUI:
         self.debt_progress_label.config(text=f"Final debt: ₱{state['remaining_debt']:,}")
  
         result_text = ""
-        if abs(state['remaining_debt']) <= 5:
+        won = debt.outcome(state['remaining_debt']) == debt.WIN
+        popup_message = debt.result_message(state['remaining_debt'])
+        if won:
             color = "#00FF7F"
-            popup_message = f"Final debt: ₱{state['remaining_debt']:,} and YOU WIN!\nDebt cleared within ₱5 margin."
             self.show_result_gif(r"win.gif", popup_message, color, 7000)
-        elif state['remaining_debt'] < -5:
-            color = "#FF4500"
-            popup_message = f"YOU LOSE!\nYou overpaid by ₱{abs(state['remaining_debt']):,}"
-            self.show_result_gif(r"lose.gif", popup_message, color, 11000)
         else:
             color = "#FF4500"
-            popup_message = f"YOU LOSE!\nYou still owe ₱{state['remaining_debt']:,}"
+            wins = debt.winning_payments(state["debt"], state["months"])
+            if wins:
+                result_text = f"Winning payments: ₱{wins[0]:,} to ₱{wins[-1]:,}"
+            else:
+                result_text = "No whole-peso payment could win this one."
             self.show_result_gif(r"lose.gif", popup_message, color, 11000)
  
         self.debt_result_label.config(text=result_text, fg=color)
         self.debt_play_btn.config(state="normal")
         
-        if abs(state['remaining_debt']) <= 5:
-            try:
-                pygame.mixer.music.load(r"Persona 4 - Specialist.mp3")
-                pygame.mixer.music.play()
-            except pygame.error:
-                pass
+        if won:
+            audio_service.play(r"Persona 4 - Specialist.mp3")
         else:
-            try:
-                pygame.mixer.music.load(r"Yakuza OST - Baka Mitai - Kiryu full versionJapanese Romaji English lyrics.mp3")
-                pygame.mixer.music.play()
-            except pygame.error:
-                pass
+            audio_service.play(r"Yakuza OST - Baka Mitai - Kiryu full versionJapanese Romaji English lyrics.mp3")
  
     def reset_debt_game(self, init=False):
-        try:
-            pygame.mixer.music.stop()
-        except pygame.error:
-            pass
-            
-        if not init:
-            try:
-                pygame.mixer.music.load("Impact Laser - Free Sound Effect-[AudioTrimmer.com].mp3")
-                pygame.mixer.music.play()
-            except pygame.error:
-                pass
+        if init:
+            audio_service.stop()
+        else:
+            audio_service.play("Impact Laser - Free Sound Effect-[AudioTrimmer.com].mp3")
  
         if self.debt_game_after_id:
             self.root.after_cancel(self.debt_game_after_id)
@@ -296,10 +316,7 @@ class RecursionGUI:
         
         self.hide_result_gif()
  
-        self.debt_game_state = {
-            "debt": random.randint(1000, 9999),
-            "months": random.randint(3, 12),
-        }
+        self.debt_game_state = debt.new_game()
         if not init:
             self.debt_payment_entry.delete(0, tk.END)
             self.debt_result_label.config(text="")
@@ -318,9 +335,57 @@ class RecursionGUI:
         if not students:
             messagebox.showerror("Error", "Please enter at least one student name.")
             return
-        present_list, trace = self.demo.head_recursion_attendance(students)
-        trace_display = trace + ["", "Reporting order (last student -> first student):"] + [f"{i+1}. {name}" for i, name in enumerate(present_list)]
-        self.update_output("Calling Attendance (Head Recursion)", trace_display)
+        self._run_attendance(students)
+ 
+    def import_roster(self):
+        """Read a CSV or text class list a chunk per Tk tick, then call attendance on it"""
+        path = filedialog.askopenfilename(parent=self.root, title="Import Roster",
+                                          filetypes=[("Class lists", "*.csv *.txt"), ("All files", "*.*")])
+        if not path:
+            return
+        self._cancel_roster_import()
+        self.roster_import = roster.open_chunks(path, dedupe=self.dedupe_roster_var.get())
+        self._import_roster_step(os.path.basename(path), [])
+ 
+    def _import_roster_step(self, name, students):
+        self.roster_import_after_id = None
+        try:
+            chunk = next(self.roster_import, None)
+        except Exception as e:
+            self._cancel_roster_import()
+            self.roster_status_label.config(text="")
+            messagebox.showerror("Import Roster", f"Could not read {name}:\n{e}")
+            return
+        if chunk is not None:
+            students.extend(chunk)
+            self.roster_status_label.config(text=f"Importing {name}... {len(students):,} names")
+            self.roster_import_after_id = self.root.after(1, lambda: self._import_roster_step(name, students))
+            return
+        self.roster_import = None
+        if not students:
+            self.roster_status_label.config(text="")
+            messagebox.showerror("Import Roster", f"No student names found in {name}.")
+            return
+        self.roster_status_label.config(text=f"Imported {len(students):,} names from {name}")
+        self._run_attendance(students)
+ 
+    def _cancel_roster_import(self):
+        if self.roster_import_after_id is not None:
+            try:
+                self.root.after_cancel(self.roster_import_after_id)
+            except Exception:
+                pass
+            self.roster_import_after_id = None
+        if self.roster_import is not None:
+            self.roster_import.close()
+            self.roster_import = None
+ 
+    def _run_attendance(self, students):
+        # The trace is regenerated for saving rather than kept, since the view only holds its tail
+        title = "Calling Attendance (Head Recursion)"
+        make_trace = partial(self.demo.attendance_events, students, calls=False)
+        self.update_output(title, make_trace())
+        self.last_output = (title, make_trace)
  
     def _on_entry_click(self, entry):
         pass
@@ -328,94 +393,108 @@ class RecursionGUI:
     def _on_focus_out(self, entry, placeholder):
         pass
  
+    def _slot_frames(self, path):
+        """(frames, durations) of ``path`` prepared for the slot; a dict lookup after the first load"""
+        cached = self.slot_cache.get(path)
+        if cached is not None:
+            cached[2].touch()
+            return cached[0], cached[1]
+        frames, durations = frame_cache.load_all(path, SLOT_SIZE, crop="center", refiner=self.refiner)
+        if frames:
+            memory = image_budget.register("RecursionGUI.slot_images", path,
+                                           evict=partial(self._evict_slot_frames, path))
+            self.slot_cache[path] = (frames, durations, memory)
+            memory.update(sum(image_budget.photo_bytes(f) for f in frames), len(frames))
+        return frames, durations
+ 
+    def _evict_slot_frames(self, path):
+        cached = self.slot_cache.pop(path, None)
+        if cached is None:
+            return
+        cached[2].release()
+        if path == self.slot_path:
+            self._drop_gif_frames()
+ 
     def _load_slot_image(self, path):
-        if self.gif_animation_after_id:
-            try:
-                self.root.after_cancel(self.gif_animation_after_id)
-            except Exception:
-                pass
-            self.gif_animation_after_id = None
+        path = asset_path(path)
+        if path == self.slot_path and path in self.slot_cache:
+            return
+        if self.gif_loop.running:
+            self.gif_loop.stop()
             self.gif_frames = []
         try:
-            img = Image.open(path)
+            frames, durations = self._slot_frames(path)
         except Exception:
-            import os
             try:
-                fallback = os.path.join(os.path.dirname(__file__), "yakuzamafia.jpg")
-                img = Image.open(fallback)
+                path = asset_path("yakuzamafia.jpg")
+                frames, durations = self._slot_frames(path)
             except Exception:
                 return
-
-        is_gif = getattr(img, 'is_animated', False)
+        if not frames:
+            return
 
         try:
             self.debt_image_slot.delete("placeholder")
         except Exception:
             pass
 
-        if is_gif:
-            self.gif_frames = []
-            try:
-                while True:
-                    frame = img.copy().convert("RGBA")
-                    width, height = frame.size
-                    min_dim = min(width, height)
-                    left, top = (width - min_dim) / 2, (height - min_dim) / 2
-                    right, bottom = (width + min_dim) / 2, (height + min_dim) / 2
-                    frame = frame.crop((left, top, right, bottom))
-                    frame = frame.resize((180, 180), Image.LANCZOS)
-                    self.gif_frames.append(ImageTk.PhotoImage(frame))
-                    img.seek(len(self.gif_frames))
-            except EOFError:
-                pass
-            
-            if self.gif_frames:
-                self._animate_gif(0)
+        # The frames are accounted to the slot cache; gif_memory only counts
+        # a frame kept on screen after its cache entry was evicted
+        self.slot_path = path
+        self.gif_memory.source = path
+        self.gif_memory.update(0, 0)
+        if len(frames) > 1:
+            self.gif_frames = frames
+            self.slot_sprite.set_frames(frames)
+            self.gif_clock = FrameClock.for_sequence(durations, default_delay=100)
+            self.gif_clock.start(0)
+            self.gif_loop.start(self._animate_gif(0))
         else:
-            width, height = img.size
-            min_dim = min(width, height)
-            left, top = (width - min_dim) / 2, (height - min_dim) / 2
-            right, bottom = (width + min_dim) / 2, (height + min_dim) / 2
-            img = img.crop((left, top, right, bottom))
-            img = img.resize((180, 180), Image.LANCZOS)
-            self.debt_image = ImageTk.PhotoImage(img)
-            if self.debt_image_id is not None:
-                self.debt_image_slot.delete(self.debt_image_id)
-            self.debt_image_id = self.debt_image_slot.create_image(90, 90, image=self.debt_image)
-
-    def _animate_gif(self, frame_index):
-        if not self.gif_frames:
-            return
-        frame = self.gif_frames[frame_index]
+            self.debt_image = frames[0]
+            self.slot_sprite.set_frames(frames)
+            self.slot_sprite.show_frame(0)
+
+    def _animate_gif(self, frame_index=None):
+        if not self.gif_frames or not self.gif_clock:
+            return None
+        if frame_index is None:
+            frame_index = self.gif_clock.tick()
+        cached = self.slot_cache.get(self.slot_path)
+        if cached is not None:
+            cached[2].touch()
         
-        if self.debt_image_id is not None:
-            self.debt_image_slot.delete(self.debt_image_id)
-        self.debt_image_id = self.debt_image_slot.create_image(90, 90, image=frame)
+        self.slot_sprite.show_frame(frame_index)
         
-        next_index = (frame_index + 1) % len(self.gif_frames)
-        self.gif_animation_after_id = self.root.after(100, self._animate_gif, next_index)
+        return self.gif_clock.delay_ms()
+
+    def _drop_gif_frames(self):
+        # The shown slot image was evicted from the cache: keep only the frame on the canvas
+        self.slot_path = None
+        if self.gif_frames:
+            self.gif_loop.stop()
+            self.debt_image = self.gif_frames[self.slot_sprite.frame_index]
+            self.gif_frames = []
+            self.slot_sprite.set_frames([self.debt_image])
+        if self.debt_image is not None:
+            self.gif_memory.update(image_budget.photo_bytes(self.debt_image), 1)
 
     def show_result_gif(self, gif_path, message, text_color, duration_ms):
         self.hide_result_gif()
 
         try:
-            img = Image.open(gif_path)
-        except FileNotFoundError:
+            self.result_gif_frames, durations = frame_cache.load_all(asset_path(gif_path), RESULT_SIZE, crop="fit",
+                                                                     refiner=self.refiner)
+        except (FileNotFoundError, OSError):
             return
 
-        self.result_gif_frames = []
-        try:
-            while True:
-                frame = img.copy().convert("RGBA")
-                frame.thumbnail((400, 400))
-                self.result_gif_frames.append(ImageTk.PhotoImage(frame))
-                img.seek(len(self.result_gif_frames))
-        except EOFError:
-            pass
-
         if not self.result_gif_frames:
             return
 
+        self.result_gif_memory = image_budget.register("RecursionGUI.result_gif_frames", gif_path,
+                                                       evict=self.hide_result_gif)
+        self.result_gif_memory.update(sum(image_budget.photo_bytes(f) for f in self.result_gif_frames),
+                                      len(self.result_gif_frames))
+
         self.result_frame = tk.Frame(self.root, bg="black", bd=0)
         self.result_frame.place(relx=0.5, rely=0.5, anchor="center")
         self.result_frame.lift()
@@ -426,27 +505,72 @@ class RecursionGUI:
         text_label = tk.Label(self.result_frame, text=message, font=("Arial", 18, "bold"), bg="black", fg=text_color, justify="center")
         text_label.pack(pady=(5, 10))
 
-        self._animate_result_gif(gif_label, 0)
+        self.result_gif_clock = FrameClock.for_sequence(durations, default_delay=100)
+        self.result_gif_clock.start(0)
+        self.result_gif_loop = AnimationLoop(gif_label, partial(self._animate_result_gif, gif_label),
+                                             on_resume=lambda: self.result_gif_clock.start(self.result_gif_clock.index))
+        self.result_gif_loop.start(self._animate_result_gif(gif_label, 0))
         self.root.after(duration_ms, self.hide_result_gif)
 
-    def _animate_result_gif(self, label, frame_index):
+    def _animate_result_gif(self, label, frame_index=None):
         if not self.result_gif_frames or not self.result_frame or not label.winfo_exists():
-            return
+            return None
+        if frame_index is None:
+            frame_index = self.result_gif_clock.tick()
         frame = self.result_gif_frames[frame_index]
+        self.result_gif_memory.touch()
         label.config(image=frame)
-        next_index = (frame_index + 1) % len(self.result_gif_frames)
-        self.result_gif_animation_id = self.root.after(100, self._animate_result_gif, label, next_index)
+        return self.result_gif_clock.delay_ms()
 
     def hide_result_gif(self):
-        if self.result_gif_animation_id:
-            self.root.after_cancel(self.result_gif_animation_id)
-            self.result_gif_animation_id = None
+        if self.result_gif_loop:
+            self.result_gif_loop.destroy()
+            self.result_gif_loop = None
 
         if self.result_frame:
             self.result_frame.destroy()
             self.result_frame = None
         
         self.result_gif_frames = []
+        self.result_gif_clock = None
+        if self.result_gif_memory is not None:
+            self.result_gif_memory.release()
+            self.result_gif_memory = None
+
+def build_warmup():
+    """Everything RecursionGUI loads, prepared off the Tk thread.
+
+    frame_cache.warm returns only once the PNGs and index of an entry are
+    on disk, so by the time the warm-up reports done the slot images and
+    result GIFs are read from the cache instead of being decoded.
+    """
+    warmup = Warmup()
+    warmup.add("mixer", audio_service.init_mixer)
+    for path in map(asset_path, SLOT_IMAGES):
+        if os.path.exists(path):
+            warmup.add(path, partial(frame_cache.warm, path, SLOT_SIZE, "center"))
+    for path in map(asset_path, RESULT_GIFS):
+        if os.path.exists(path):
+            warmup.add(path, partial(frame_cache.warm, path, RESULT_SIZE, "fit"), weight=3)
+    warmup.add("debt sounds", partial(audio_service.preload_now, *RecursionGUI.DEBT_TRACKS))
+    return warmup
+
+
+def launch_with_splash(root, on_ready, min_display_ms=0):
+    """Show the loading splash while the assets are prepared, then call ``on_ready(splash)``"""
+    splash = create_splash_screen(root)
+    shown_at = time.monotonic()
+
+    def ready():
+        wait = max(0, int(min_display_ms - (time.monotonic() - shown_at) * 1000))
+        root.after(wait, lambda: on_ready(splash))
+
+    def progress(fraction):
+        splash.progress["value"] = fraction * 100
+
+    build_warmup().start(splash, on_progress=progress, on_done=ready)
+    return splash
+
 
 def create_splash_screen(root):
     splash = tk.Toplevel(root)
@@ -466,21 +590,20 @@ def create_splash_screen(root):
  
     progress = ttk.Progressbar(splash, orient="horizontal", length=300, mode='determinate')
     progress.pack(pady=20)
-    progress.start(15)
+    splash.progress = progress
  
     return splash
  
 def main_app():
     root = tk.Tk()
     root.withdraw()
-    splash = create_splash_screen(root)
  
-    def launch_app():
+    def launch_app(splash):
         splash.destroy()
         app = RecursionGUI(root)
         root.deiconify()
  
-    root.after(3000, launch_app)
+    launch_with_splash(root, launch_app)
     root.mainloop()
  
 if __name__ == "__main__":
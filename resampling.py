@@ -0,0 +1,168 @@
+import math
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+import profiler
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+    DRAFT_FILTER = Image.BILINEAR
+    FINAL_FILTER = Image.LANCZOS
+except ImportError:
+    HAS_PIL = False
+    DRAFT_FILTER = FINAL_FILTER = None
+
+# Two-tier resizing: a draft frame is produced right away with a cheap
+# filter (and, for JPEGs, a reduced-scale decode via ``draft()``), while
+# the LANCZOS version is computed on a worker and pasted over it later.
+
+_pool = None
+
+
+def _executor():
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="resample")
+    return _pool
+
+
+def output_size(src_size, target_size, crop=None):
+    """Final size of a frame, computed from the full-resolution source size"""
+    if target_size is None:
+        return tuple(src_size)
+    if crop == "fit":
+        w, h = src_size
+        scale = min(target_size[0] / w, target_size[1] / h, 1.0)
+        return max(1, round(w * scale)), max(1, round(h * scale))
+    return tuple(target_size)
+
+
+def draft_request(src_size, target_size, crop=None):
+    """Smallest decode size that still covers the output after cropping"""
+    w, h = src_size
+    if crop == "center":
+        side = max(target_size)
+        min_dim = min(w, h)
+        return math.ceil(w * side / min_dim), math.ceil(h * side / min_dim)
+    return output_size(src_size, target_size, crop)
+
+
+def open_image(path, target_size=None, crop=None, draft=False):
+    """Open ``path``; with ``draft`` let the JPEG decoder scale down while decoding.
+
+    Returns the image and its full-resolution size.
+    """
+    img = Image.open(path)
+    src_size = img.size
+    if draft and target_size is not None and img.format == "JPEG":
+        try:
+            img.draft("RGB", draft_request(src_size, target_size, crop))
+        except Exception:
+            pass
+    return img, src_size
+
+
+def prepare_frame(frame, target_size=None, crop=None, resample=FINAL_FILTER, src_size=None):
+    """Convert a PIL frame to RGBA and bring it to its output size.
+
+    ``crop`` selects how the size is reached: ``None`` stretches, ``"center"``
+    center-crops to a square first and ``"fit"`` shrinks inside the box
+    keeping the aspect ratio. ``src_size`` is the full-resolution size when
+    ``frame`` came from a reduced (draft) decode, so both tiers end up with
+    exactly the same dimensions.
+    """
+    try:
+        frame = frame.convert('RGBA')
+    except Exception:
+        frame = frame.convert('RGB')
+    if target_size is None:
+        return frame
+    out = output_size(src_size or frame.size, target_size, crop)
+    if crop == "center":
+        width, height = frame.size
+        min_dim = min(width, height)
+        left, top = (width - min_dim) / 2, (height - min_dim) / 2
+        frame = frame.crop((left, top, left + min_dim, top + min_dim))
+    if frame.size == out:
+        return frame
+    try:
+        if resample is FINAL_FILTER:
+            return frame.resize(out, resample)
+        return frame.resize(out, resample, reducing_gap=2.0)
+    except Exception:
+        return frame
+
+
+def refine_job(raw, target_size, crop=None, reopen_path=None):
+    """Build the background LANCZOS job for one frame.
+
+    ``raw`` is the full-resolution frame already decoded for the draft. When
+    the draft came from a reduced JPEG decode, pass ``reopen_path`` so the
+    worker decodes the file again at full size.
+    """
+    def job():
+        with profiler.span("refine", "asset", size=list(target_size)):
+            if reopen_path is not None:
+                with Image.open(reopen_path) as img:
+                    img.load()
+                    return prepare_frame(img, target_size, crop)
+            return prepare_frame(raw, target_size, crop)
+    return job
+
+
+class Refiner:
+    """Runs refinement jobs on worker threads and applies them on the Tk thread"""
+
+    def __init__(self, widget, poll_ms=30):
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self._pending = []
+        self._after_id = None
+
+    def submit(self, job, apply):
+        self._pending.append((_executor().submit(job), apply))
+        if self._after_id is None:
+            try:
+                self._after_id = self.widget.after(self.poll_ms, self._poll)
+            except tk.TclError:
+                self.cancel()
+
+    def _poll(self):
+        self._after_id = None
+        waiting = []
+        for future, apply in self._pending:
+            if not future.done():
+                waiting.append((future, apply))
+                continue
+            if future.cancelled():
+                continue
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Refine failed: {e}")
+                continue
+            try:
+                apply(result)
+            except Exception:
+                pass
+        self._pending = waiting
+        if waiting:
+            try:
+                self._after_id = self.widget.after(self.poll_ms, self._poll)
+            except tk.TclError:
+                self.cancel()
+
+    def pending(self):
+        return len(self._pending)
+
+    def cancel(self):
+        for future, _ in self._pending:
+            future.cancel()
+        self._pending = []
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
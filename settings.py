@@ -0,0 +1,22 @@
+import math
+import os
+
+
+def number(name, default, cast=float):
+    """Environment variable ``name`` as a number, or ``default`` when it is unset or malformed.
+
+    The value is parsed as a float and then passed through ``cast``, so
+    ``"2.5"`` works for int settings too; a bad value is reported and
+    ignored instead of stopping the app at import time.
+    """
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = math.nan
+    if not math.isfinite(value):
+        print(f"Ignoring {name}={raw!r}: not a number, using {default}")
+        return default
+    return cast(value)
@@ -0,0 +1,145 @@
+class Sprite:
+    """One canvas item that is created once and then updated in place.
+
+    ``place``/``move`` go through ``coords``/``move`` and ``configure``
+    through ``itemconfigure``; both remember what the item already has,
+    so setting an unchanged value costs no Tcl call at all.  An image
+    sprite can hold a frame sequence and step through it with
+    ``show_frame``.
+    """
+
+    def __init__(self, canvas, kind, coords, z=0, tags=(), **options):
+        self.canvas = canvas
+        self.kind = kind
+        self.z = z
+        self.coords = tuple(coords)
+        self.options = dict(options)
+        self.visible = True
+        self.frames = []
+        self.frame_index = 0
+        create = getattr(canvas, "create_" + kind)
+        self.item = create(*self.coords, tags=(_z_tag(z),) + tuple(tags), **options)
+
+    def place(self, *coords):
+        if coords != self.coords:
+            self.canvas.coords(self.item, *coords)
+            self.coords = coords
+
+    def move(self, dx, dy):
+        if not dx and not dy:
+            return
+        self.canvas.move(self.item, dx, dy)
+        self.coords = tuple(c + (dy if i % 2 else dx) for i, c in enumerate(self.coords))
+
+    def configure(self, **options):
+        changed = {k: v for k, v in options.items() if k not in self.options or not _same(self.options[k], v)}
+        if changed:
+            self.canvas.itemconfigure(self.item, **changed)
+            self.options.update(changed)
+
+    def show(self):
+        if not self.visible:
+            self.canvas.itemconfigure(self.item, state="normal")
+            self.visible = True
+
+    def hide(self):
+        if self.visible:
+            self.canvas.itemconfigure(self.item, state="hidden")
+            self.visible = False
+
+    def set_frames(self, frames):
+        self.frames = list(frames)
+        self.frame_index = 0
+
+    def show_frame(self, index):
+        """Point the image item at frame ``index`` of the sequence"""
+        if not self.frames:
+            return
+        self.frame_index = index % len(self.frames)
+        self.configure(image=self.frames[self.frame_index])
+
+    def delete(self):
+        try:
+            self.canvas.delete(self.item)
+        except Exception:
+            pass
+        self.frames = []
+
+
+def _same(a, b):
+    return a is b or a == b
+
+
+def _z_tag(z):
+    return f"z:{z}"
+
+
+class SpriteLayer:
+    """Sprites on one canvas, kept by key and reused from redraw to redraw.
+
+    A redraw is ``begin()``, one ``sprite()`` call per thing to show and
+    ``end()``: sprites asked for again are moved and reconfigured in
+    place, new ones are created, and ones not asked for are hidden for
+    later reuse instead of being deleted.  ``z`` orders sprites (higher
+    is drawn on top); the canvas is only restacked when a new sprite or
+    a changed ``z`` calls for it.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.sprites = {}
+        self._used = None
+        self._restack = False
+        self._top_z = None
+
+    def begin(self):
+        self._used = set()
+
+    def sprite(self, key, kind, coords, z=0, **options):
+        sprite = self.sprites.get(key)
+        if sprite is not None and sprite.kind != kind:
+            sprite.delete()
+            sprite = None
+        if sprite is None:
+            sprite = Sprite(self.canvas, kind, coords, z, **options)
+            self.sprites[key] = sprite
+            # New items are created on top; restack only if something should stay above it
+            if self._top_z is not None and self._top_z > z:
+                self._restack = True
+            self._top_z = z if self._top_z is None else max(self._top_z, z)
+        else:
+            sprite.place(*coords)
+            sprite.configure(**options)
+            sprite.show()
+            if sprite.z != z:
+                self.canvas.dtag(sprite.item, _z_tag(sprite.z))
+                self.canvas.addtag_withtag(_z_tag(z), sprite.item)
+                sprite.z = z
+                self._top_z = max(self._top_z, z)
+                self._restack = True
+        if self._used is not None:
+            self._used.add(key)
+        return sprite
+
+    def end(self):
+        if self._used is not None:
+            for key, sprite in self.sprites.items():
+                if key not in self._used:
+                    sprite.hide()
+            self._used = None
+        if self._restack:
+            for z in sorted({s.z for s in self.sprites.values()}):
+                self.canvas.tag_raise(_z_tag(z))
+            self._restack = False
+
+    def get(self, key):
+        return self.sprites.get(key)
+
+    def clear(self):
+        """Delete every sprite (and only the sprites) from the canvas"""
+        for sprite in self.sprites.values():
+            sprite.delete()
+        self.sprites.clear()
+        self._used = None
+        self._restack = False
+        self._top_z = None
@@ -5,15 +5,16 @@ from tkinter import font, messagebox
 from typing import List, Optional, Tuple
 
 try:
-    from PIL import Image, ImageTk, ImageSequence
+    from PIL import Image
 except Exception:
-    Image = ImageTk = ImageSequence = None
+    Image = None
 
-try:
-    import pygame
-    pygame.mixer.init()
-except Exception:
-    pygame = None
+from animated_gif import AnimationLoop, FrameClock, FrameSource
+from asset_bundle import resolve_sound
+import audio_service
+from core.stack import EMPTY_VALUE, MAX_CHARS, MAX_STACK, NOT_NUMERIC, Stack, StackError
+from resampling import Refiner
+from sprites import SpriteLayer
 
 try:
     import winsound
@@ -21,7 +22,6 @@ except Exception:
     winsound = None
 
 DEFAULT_EXTS = ('.gif', '.jpg', '.png', '.jpeg', '.bmp')
-MAX_STACK = 10
 POPUP_MAX_SIZE = (360, 360)
 WINDOW_BG = 'pink'
 BOX_BG = 'pink'
@@ -30,7 +30,8 @@ BUTTON_BG = 'black'
 BUTTON_FG = 'white'
 BOX_HEIGHT = 38
 BOX_SIDE_PAD = 6
-MAX_CHARS = 36
+BOX_GAP = 8
+EMPTY_BOX_WIDTH = 224
 
 SOUND_FILES = {
     'push': 'push',
@@ -85,22 +86,29 @@ def _sound_path(name: str) -> Optional[str]:
         for ext in exts:
             p = os.path.join(d, base + ext)
             if os.path.exists(p):
-                return p
+                return resolve_sound(p)
     return None
 
 
+def preload_sounds() -> int:
+    """Decode every sound effect into the shared effect bank; returns how many are ready"""
+    paths = [p for p in (_sound_path(name) for name in SOUND_FILES) if p]
+    return audio_service.preload_effects(paths, SOUND_VOLUME)
+
+
+def popup_images() -> List[str]:
+    """Paths of every image the stack app may show in a popup"""
+    bases = ['overflow', 'clear', 'invalid', 'push_invalid', 'pop_invalid', 'peek_invalid']
+    bases += [data[2] for data in KEYWORD_DATA.values()]
+    return [p for p in (find_image(b) for b in bases) if p]
+
+
 def play_sound(name: str, loops: int = 0):
     path = _sound_path(name)
     if not path:
         return
-    if pygame:
-        try:
-            snd = pygame.mixer.Sound(path)
-            snd.set_volume(SOUND_VOLUME)
-            snd.play(loops=loops)
-            return
-        except Exception:
-            pass
+    if audio_service.play_effect(path, loops, SOUND_VOLUME):
+        return
     if winsound and sys.platform.startswith('win') and path.lower().endswith('.wav'):
         try:
             winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC)
@@ -120,9 +128,12 @@ class ImagePopup:
 
         self.root = None
         self._label_img = None
-        self._frames = [100]
+        self._source = None
+        self._refiner = None
+        self._current = None
+        self._clock = None
+        self._loop = None
         self._frame_index = 0
-        self._after_id = None
 
         self._open_popup()
 
@@ -161,34 +172,19 @@ class ImagePopup:
                 pass
             return
 
-        try:
-            img = Image.open(self.image_path)
-        except Exception as e:
-            tk.Label(self.root, text=f"Error loading image:\n{e}", fg='red', bg=WINDOW_BG).pack(padx=12, pady=12)
+        # Frames are decoded lazily; the first one is a fast draft that is
+        # swapped for the LANCZOS version once the worker finishes it.
+        self._refiner = Refiner(self.root)
+        self._source = FrameSource(self.image_path, target_size=self.max_size, crop='fit',
+                                   owner='ImagePopup', refiner=self._refiner)
+        self._current = self._source.get(0)
+        if self._current is None:
+            tk.Label(self.root, text=f"Error loading image:\n{os.path.basename(self.image_path)}", fg='red', bg=WINDOW_BG).pack(padx=12, pady=12)
             tk.Button(self.root, text='Close', command=self._close, bg=BUTTON_BG, fg=BUTTON_FG).pack(pady=(0, 12))
             return
 
-        is_animated = getattr(img, "is_animated", False)
-        if is_animated and ImageSequence is not None:
-            self._frames = []
-            try:
-                for frame in ImageSequence.Iterator(img):
-                    frame = frame.copy()
-                    frame.thumbnail(self.max_size, Image.LANCZOS)
-                    photo = ImageTk.PhotoImage(frame)
-                    self._frames.append(photo)
-            except Exception:
-                img.thumbnail(self.max_size, Image.LANCZOS)
-                self._frames = [ImageTk.PhotoImage(img)]
-        else:
-            try:
-                img.thumbnail(self.max_size, Image.LANCZOS)
-            except Exception:
-                img.thumbnail(self.max_size)
-            self._frames = [ImageTk.PhotoImage(img)]
-
-        self._label_img = tk.Label(self.root, image=self._frames[0], bg=WINDOW_BG)
-        self._label_img.image = self._frames[0]
+        self._label_img = tk.Label(self.root, image=self._current, bg=WINDOW_BG)
+        self._label_img.image = self._current
         self._label_img.pack(padx=12, pady=(12, 6))
 
         tk.Label(self.root, text=self.message, bg=WINDOW_BG, fg='black', font=("Arial", 11, 'bold')).pack(padx=12, pady=(0, 8))
@@ -200,9 +196,12 @@ class ImagePopup:
         else:
             tk.Button(self.root, text='Close', command=self._close, bg=BUTTON_BG, fg=BUTTON_FG).pack(pady=(0, 12))
 
-        if len(self._frames) > 1:
+        if self._source.is_animated():
             self._frame_index = 0
-            self._animate()
+            self._clock = FrameClock(self._source.next_index, self._source.duration, default_delay=100)
+            self._loop = AnimationLoop(self._label_img, self._animate,
+                                       on_resume=lambda: self._clock.start(self._frame_index))
+            self._loop.start(self._clock.start(0))
 
         if self.confirm:
             try:
@@ -213,23 +212,29 @@ class ImagePopup:
                 pass
 
     def _animate(self):
-        if not self.root or not self._frames:
-            return
-        self._frame_index = (self._frame_index + 1) % len(self._frames)
-        f = self._frames[self._frame_index]
-        try:
-            self._label_img.config(image=f)
-            self._label_img.image = f
-        except Exception:
-            pass
-        self._after_id = self.root.after(100, self._animate)
+        if not self.root or not self._source or not self._clock:
+            return None
+        index = self._clock.tick()
+        f = self._source.get(index)
+        if f is None:
+            return None
+        self._frame_index = index
+        if f is not self._current:
+            self._current = f
+            try:
+                self._label_img.config(image=f)
+                self._label_img.image = f
+            except Exception:
+                pass
+        return self._clock.delay_ms()
 
     def _close(self):
-        try:
-            if self._after_id and self.root:
-                self.root.after_cancel(self._after_id)
-        except Exception:
-            pass
+        if self._loop is not None:
+            self._loop.destroy()
+            self._loop = None
+        if self._source is not None:
+            self._source.close()
+            self._source = None
         try:
             self.root.destroy()
         except Exception:
@@ -255,7 +260,7 @@ class AsciiStackApp:
         self.root.title('Stack UI (GIF & Sound)')
         self.root.config(bg=WINDOW_BG)
         self.script_dir = _script_dir()
-        self.stack: List[str] = []
+        self.stack = Stack(MAX_STACK, MAX_CHARS)
         self._build_ui()
         self.update_info()
         self.draw()
@@ -283,8 +288,9 @@ class AsciiStackApp:
         self.info_label = tk.Label(info, text=f'Stacks: 0 / {MAX_STACK}', bg='white', fg='black', width=45, anchor='w')
         self.info_label.pack(anchor='w')
 
-        self.stack_area = tk.Frame(self.root, bg=WINDOW_BG)
-        self.stack_area.pack(padx=10, pady=(10, 12), fill='both')
+        self.stack_canvas = tk.Canvas(self.root, bg=WINDOW_BG, highlightthickness=0, height=BOX_HEIGHT + BOX_GAP)
+        self.stack_canvas.pack(padx=10, pady=(10, 12), fill='both')
+        self.stack_layer = SpriteLayer(self.stack_canvas)
 
         self.status = tk.Label(self.root, text='Ready', anchor='w', bg=WINDOW_BG)
         self.status.pack(fill='x', padx=10, pady=(0, 10))
@@ -296,6 +302,8 @@ class AsciiStackApp:
         except Exception:
             fam, size = 'Courier', 11
         self.mono_font = font.Font(family=fam, size=size, weight='bold')
+        self.top_font = font.Font(family=fam, size=max(size - 2, 8), weight='bold')
+        self.stack_canvas.configure(width=BOX_SIDE_PAD + self._box_width('0' * MAX_CHARS) + BOX_GAP)
 
     def set_status(self, text: str):
         self.status.config(text=text)
@@ -348,31 +356,27 @@ class AsciiStackApp:
                 pass
 
     def push(self):
-        v = self.entry.get().strip()
-        if not v:
-            try:
-                self._show_alert('push_invalid', 'Invalid push', 'Cant push nothing.', sound_name='push_invalid')
-            except Exception:
+        try:
+            v = self.stack.push(self.entry.get())
+        except StackError as e:
+            if e.reason == EMPTY_VALUE:
                 try:
-                    self._show_alert('invalid', 'Invalid push', 'Cannot push empty value.', sound_name='invalid')
+                    self._show_alert('push_invalid', 'Invalid push', 'Cant push nothing.', sound_name='push_invalid')
                 except Exception:
-                    self.set_status('Cannot push empty value.')
-            return
-        if not v.isdigit():
-            try:
-                self._show_alert('invalid', 'Invalid input', "Yea numbers only", sound_name='invalid')
-            except Exception:
-                self.set_status('Invalid input: non-numeric characters detected.')
-            return
-        if len(self.stack) >= MAX_STACK:
-            self.set_status('Overflow! Cannot add more stacks.')
-            self.update_info()
+                    try:
+                        self._show_alert('invalid', 'Invalid push', 'Cannot push empty value.', sound_name='invalid')
+                    except Exception:
+                        self.set_status(str(e))
+            elif e.reason == NOT_NUMERIC:
+                try:
+                    self._show_alert('invalid', 'Invalid input', "Yea numbers only", sound_name='invalid')
+                except Exception:
+                    self.set_status(str(e))
+            else:
+                self.set_status(str(e))
+                self.update_info()
             return
 
-        if len(v) > MAX_CHARS:
-            v = v[:MAX_CHARS - 3] + '...'
-
-        self.stack.append(v)
         try:
             self.entry.delete(0, tk.END)
         except Exception:
@@ -403,7 +407,7 @@ class AsciiStackApp:
             self._show_alert('peek_invalid', 'Peek empty', 'Peek: stack is empty.', sound_name='peek_invalid')
             self.peek_label.config(text='(empty)')
             return
-        v = self.stack[-1]
+        v = self.stack.peek()
         self.peek_label.config(text=v)
         self.set_status(f'Top: {v}')
         play_sound('peek')
@@ -441,42 +445,44 @@ class AsciiStackApp:
                 play_sound('clear')
 
     def draw(self):
-        for c in self.stack_area.winfo_children():
-            c.destroy()
+        # Boxes are canvas sprites reused by slot, so a push or pop only
+        # reconfigures the items that changed
+        layer = self.stack_layer
+        layer.begin()
         if not self.stack:
             self._draw_empty()
-            return
-        for idx, item in enumerate(reversed(self.stack)):
-            self._draw_box(item, top=(idx == 0))
+        else:
+            for idx, item in enumerate(reversed(self.stack)):
+                self._draw_box(idx, item, top=(idx == 0))
+        layer.end()
+        height = max(1, len(self.stack)) * (BOX_HEIGHT + BOX_GAP)
+        if int(self.stack_canvas.cget('height')) != height:
+            self.stack_canvas.configure(height=height)
+
+    def _box_width(self, text: str) -> int:
+        char_w = self.mono_font.measure('0') if hasattr(self.mono_font, 'measure') else 8
+        target_chars = min(MAX_CHARS, max(12, len(text)))
+        return target_chars * char_w + 40
 
     def _draw_empty(self):
-        outer = tk.Frame(self.stack_area, bg=BOX_BORDER, height=BOX_HEIGHT)
-        outer.pack(anchor='w', pady=4, padx=(BOX_SIDE_PAD, 0))
-        outer.pack_propagate(False)
-        inner = tk.Frame(outer, bg=BOX_BG)
-        inner.place(x=2, y=2, width=220, height=BOX_HEIGHT - 4)
-        lbl = tk.Label(inner, text='[ empty stack :3 ]', bg=BOX_BG,
-                       fg='black', anchor='w', padx=8, font=self.mono_font)
-        lbl.pack(fill='both', expand=True)
-
-    def _draw_box(self, text: str, top: bool = False):
+        self._draw_slot(0, '[ empty stack :3 ]', EMPTY_BOX_WIDTH)
+
+    def _draw_box(self, idx: int, text: str, top: bool = False):
         display_text = str(text)
-        char_w = self.mono_font.measure('0') if hasattr(self.mono_font, 'measure') else 8
-        target_chars = min(MAX_CHARS, max(12, len(display_text)))
-        box_w = target_chars * char_w + 40
-        outer = tk.Frame(self.stack_area, bg=BOX_BORDER, height=BOX_HEIGHT, width=box_w)
-        outer.pack(anchor='w', pady=4, padx=(BOX_SIDE_PAD, 0))
-        outer.pack_propagate(False)
-        inner = tk.Frame(outer, bg=BOX_BG)
-        inner.place(x=2, y=2, width=box_w - 4, height=BOX_HEIGHT - 4)
-        lbl = tk.Label(inner, text=display_text, bg=BOX_BG,
-                       fg='black', anchor='w', padx=8, font=self.mono_font, width=target_chars)
-        lbl.pack(fill='both', expand=True)
+        box_w = self._draw_slot(idx, display_text, self._box_width(display_text))
         if top:
-            top_font = font.Font(family=self.mono_font.actual().get('family', 'Courier'),
-                                 size=max(self.mono_font.actual().get('size', 9) - 2, 8), weight='bold')
-            top_lbl = tk.Label(inner, text='TOP', bg=BOX_BG, fg='black', font=top_font)
-            top_lbl.place(relx=0.95, rely=0.5, anchor='e')
+            y = idx * (BOX_HEIGHT + BOX_GAP) + BOX_GAP // 2
+            self.stack_layer.sprite('top', 'text', (BOX_SIDE_PAD + box_w * 0.95, y + BOX_HEIGHT // 2), z=1,
+                                    text='TOP', anchor='e', fill='black', font=self.top_font)
+
+    def _draw_slot(self, idx: int, text: str, box_w: int) -> int:
+        x = BOX_SIDE_PAD
+        y = idx * (BOX_HEIGHT + BOX_GAP) + BOX_GAP // 2
+        self.stack_layer.sprite(('box', idx), 'rectangle', (x + 1, y + 1, x + box_w - 1, y + BOX_HEIGHT - 1), z=0,
+                                fill=BOX_BG, outline=BOX_BORDER, width=2)
+        self.stack_layer.sprite(('text', idx), 'text', (x + 10, y + BOX_HEIGHT // 2), z=1,
+                                text=text, anchor='w', fill='black', font=self.mono_font)
+        return box_w
 
 
 if __name__ == '__main__':
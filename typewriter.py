@@ -0,0 +1,121 @@
+import os
+from collections import deque
+
+from animated_gif import AnimationLoop
+import settings
+
+# Characters typed per tick and ms between ticks; the defaults type about
+# 200 characters a second.  VISUALIZER_TYPE_INSTANT=1 skips the effect.
+CHARS_PER_TICK = settings.number("VISUALIZER_TYPE_CHARS", 6, int)
+TICK_MS = settings.number("VISUALIZER_TYPE_TICK_MS", 30, int)
+INSTANT = os.environ.get("VISUALIZER_TYPE_INSTANT", "") not in ("", "0")
+# Lines kept in the widget; older ones are trimmed as new ones arrive (0 keeps all)
+MAX_LINES = settings.number("VISUALIZER_OUTPUT_MAX_LINES", 2000, int)
+
+
+class Typewriter:
+    """Types lines into a read-only Text widget, a batch of characters per tick.
+
+    Lines are pulled lazily from any iterable, so a generator is only
+    advanced as fast as the text appears.  Every tick costs the same
+    regardless of how long the trace is: at most ``chars_per_tick``
+    characters are taken, then one insert and one ``see`` are made.
+    ``skip()`` (or ``instant=True``) writes everything that is left in a
+    single insert.  Typing pauses while the widget is hidden.
+
+    With ``max_lines`` the widget never holds more than that many lines:
+    the oldest are deleted after each insert, and ``skip()`` only keeps
+    the last ``max_lines`` of the remaining text, so inserting and
+    scrolling stay cheap however long the run is.
+    """
+
+    def __init__(self, text, chars_per_tick=CHARS_PER_TICK, tick_ms=TICK_MS, instant=INSTANT, on_done=None,
+                 max_lines=MAX_LINES):
+        self.text = text
+        self.max_lines = max(0, max_lines)
+        self.chars_per_tick = max(1, chars_per_tick)
+        self.tick_ms = max(1, tick_ms)
+        self.instant = instant
+        self.on_done = on_done
+        self._lines = iter(())
+        self._pending = ""
+        self.loop = AnimationLoop(text, self._tick)
+
+    @property
+    def running(self):
+        return self.loop.running
+
+    def write(self, chunk):
+        """Insert ``chunk`` at the end right away"""
+        if not chunk:
+            return
+        self.text.config(state="normal")
+        self.text.insert("end", chunk)
+        self._trim()
+        self.text.see("end")
+        self.text.config(state="disabled")
+
+    def start(self, lines):
+        """Type ``lines`` after whatever is already shown"""
+        self.cancel()
+        self._lines = iter(lines)
+        if self.instant:
+            self.skip()
+        else:
+            self.loop.start()
+
+    def skip(self):
+        """Write all remaining text in one go"""
+        if self._pending is None:
+            return
+        lines = deque(self._lines, maxlen=self.max_lines) if self.max_lines else self._lines
+        rest = self._pending + "".join(line + "\n" for line in lines)
+        self.write(rest)
+        self._finish()
+
+    def cancel(self):
+        self.loop.stop()
+        self._lines = iter(())
+        self._pending = ""
+
+    def destroy(self):
+        self.cancel()
+        self.loop.destroy()
+
+    def _trim(self):
+        if not self.max_lines:
+            return
+        # "end-1c" sits on the line being typed, after the last newline
+        excess = int(self.text.index("end-1c").split(".")[0]) - 1 - self.max_lines
+        if excess > 0:
+            self.text.delete("1.0", f"{excess + 1}.0")
+
+    def _take(self, limit):
+        parts = []
+        size = 0
+        while size < limit:
+            if not self._pending:
+                line = next(self._lines, None)
+                if line is None:
+                    break
+                self._pending = line + "\n"
+            piece = self._pending[:limit - size]
+            self._pending = self._pending[len(piece):]
+            parts.append(piece)
+            size += len(piece)
+        return "".join(parts)
+
+    def _tick(self):
+        chunk = self._take(self.chars_per_tick)
+        self.write(chunk)
+        if len(chunk) < self.chars_per_tick:
+            self._finish()
+            return None
+        return self.tick_ms
+
+    def _finish(self):
+        self.loop.stop()
+        self._lines = iter(())
+        self._pending = None
+        if self.on_done is not None:
+            self.on_done()
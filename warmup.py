@@ -0,0 +1,123 @@
+import time
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+import profiler
+
+
+class WarmupTask:
+    def __init__(self, name, func, weight=1, then=None):
+        self.name = name
+        self.func = func
+        self.weight = weight
+        self.then = then
+        self.future = None
+        self.elapsed = 0.0
+        self.seconds = None
+        self.error = None
+
+
+class Warmup:
+    """Runs startup tasks on a worker pool and reports real progress.
+
+    ``func`` runs on a worker and must not touch Tk; its result is passed
+    to the optional ``then`` callback on the Tk thread, which is where
+    PhotoImages and widgets may be created. Progress is the weight of the
+    finished tasks over the total weight. A failing task is reported and
+    counted as done so startup never hangs on it.
+    """
+
+    def __init__(self, workers=3):
+        self.workers = workers
+        self.tasks = []
+        self.started_at = None
+        self.finished_at = None
+        self._pool = None
+        self._widget = None
+        self._after_id = None
+        self._on_progress = None
+        self._on_done = None
+
+    def add(self, name, func, weight=1, then=None):
+        task = WarmupTask(name, func, weight, then)
+        self.tasks.append(task)
+        return task
+
+    def fraction(self):
+        total = sum(t.weight for t in self.tasks)
+        if not total:
+            return 1.0
+        return sum(t.weight for t in self.tasks if t.seconds is not None) / total
+
+    def done(self):
+        return all(t.seconds is not None for t in self.tasks)
+
+    def start(self, widget, on_progress=None, on_done=None, poll_ms=30):
+        self._widget = widget
+        self._on_progress = on_progress
+        self._on_done = on_done
+        self.poll_ms = poll_ms
+        self.started_at = time.monotonic()
+        if self.tasks:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="warmup")
+            for task in self.tasks:
+                task.future = self._pool.submit(self._run, task)
+        self._poll()
+
+    @staticmethod
+    def _run(task):
+        t0 = time.perf_counter()
+        try:
+            return task.func()
+        finally:
+            end = time.perf_counter()
+            task.elapsed = end - t0
+            profiler.record(f"warmup {task.name}", t0, end, "warmup")
+
+    def _poll(self):
+        self._after_id = None
+        for task in self.tasks:
+            if task.seconds is not None or not task.future.done():
+                continue
+            task.seconds = task.elapsed
+            try:
+                result = task.future.result()
+                if task.then is not None:
+                    task.then(result)
+            except Exception as e:
+                task.error = e
+                print(f"Warm-up task '{task.name}' failed: {e}")
+        if self._on_progress is not None:
+            self._on_progress(self.fraction())
+        if self.done():
+            self.finished_at = time.monotonic()
+            self._shutdown()
+            if self._on_done is not None:
+                self._on_done()
+            return
+        try:
+            self._after_id = self._widget.after(self.poll_ms, self._poll)
+        except tk.TclError:
+            self.cancel()
+
+    def report(self):
+        """(name, seconds, error) per task, slowest first"""
+        rows = [(t.name, t.seconds, t.error) for t in self.tasks]
+        return sorted(rows, key=lambda r: -(r[1] or 0))
+
+    def _shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def cancel(self):
+        if self._after_id is not None:
+            try:
+                self._widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        for task in self.tasks:
+            if task.future is not None:
+                task.future.cancel()
+        self._shutdown()
@@ -0,0 +1,133 @@
+import time
+import tkinter as tk
+from collections import OrderedDict
+
+import image_budget
+import settings
+
+# Closed sub-app windows are kept withdrawn for this many seconds so the
+# next click just shows them again (0 turns this off) ...
+KEEP_IDLE_S = settings.number("VISUALIZER_KEEP_WINDOWS_S", 300.0)
+# ... as long as the hidden windows together stay under this estimate
+KEEP_BUDGET = int(settings.number("VISUALIZER_KEEP_WINDOWS_MB", 8) * 1024 * 1024)
+
+# Rough cost of one Tk widget (Tcl object, command, options, Python wrapper)
+WIDGET_BYTES = 4096
+
+
+def estimate_bytes(window):
+    """Approximate memory held by a window's widget tree.
+
+    Images are left out: the frames a window shows are already registered
+    with :mod:`image_budget` by their owners (FrameSource, the slot cache,
+    ...), and counting them here as well would charge them twice.
+    """
+    widgets = 0
+    stack = [window]
+    while stack:
+        widget = stack.pop()
+        widgets += 1
+        try:
+            stack.extend(widget.winfo_children())
+        except tk.TclError:
+            continue
+    return widgets * WIDGET_BYTES
+
+
+class HiddenWindow:
+    def __init__(self, window, nbytes):
+        self.window = window
+        self.nbytes = nbytes
+        self.hidden_at = time.monotonic()
+        self.after_id = None
+        self.memory = None
+
+
+class WindowPool:
+    """Keeps closed sub-app windows alive but withdrawn for an instant reopen.
+
+    ``release()`` withdraws a window instead of destroying it and
+    ``take()`` hands it back with its widget tree, state and caches intact.
+    A hidden window is really destroyed once it has been idle for
+    ``max_idle_s`` seconds, when the hidden windows together exceed
+    ``budget`` bytes (least recently hidden first), or when the global
+    :mod:`image_budget` needs the memory back.
+    """
+
+    def __init__(self, root, max_idle_s=KEEP_IDLE_S, budget=KEEP_BUDGET):
+        self.root = root
+        self.max_idle_s = max_idle_s
+        self.budget = budget
+        self._hidden = OrderedDict()
+
+    def enabled(self):
+        return self.max_idle_s > 0 and self.budget > 0
+
+    def take(self, key):
+        """The hidden window for ``key`` (still withdrawn), or None"""
+        entry = self._hidden.pop(key, None)
+        if entry is None:
+            return None
+        self._forget(entry)
+        try:
+            if entry.window.winfo_exists():
+                return entry.window
+        except tk.TclError:
+            pass
+        return None
+
+    def release(self, key, window):
+        """Withdraw ``window`` and keep it for ``key``; False if it should be destroyed instead"""
+        if not self.enabled():
+            return False
+        self.discard(key)
+        try:
+            window.withdraw()
+            nbytes = estimate_bytes(window)
+        except tk.TclError:
+            return False
+        if nbytes > self.budget:
+            return False
+        entry = HiddenWindow(window, nbytes)
+        self._hidden[key] = entry
+        entry.after_id = self.root.after(int(self.max_idle_s * 1000), lambda: self.discard(key))
+        entry.memory = image_budget.register("WindowPool", key, evict=lambda: self.discard(key))
+        entry.memory.update(nbytes, 0)
+        self._enforce(keep=key)
+        return True
+
+    def discard(self, key):
+        """Really destroy the hidden window for ``key``, if any"""
+        entry = self._hidden.pop(key, None)
+        if entry is None:
+            return
+        self._forget(entry)
+        try:
+            entry.window.destroy()
+        except tk.TclError:
+            pass
+
+    def clear(self):
+        for key in list(self._hidden):
+            self.discard(key)
+
+    def usage(self):
+        return sum(e.nbytes for e in self._hidden.values())
+
+    def _enforce(self, keep=None):
+        for key in list(self._hidden):
+            if self.usage() <= self.budget:
+                break
+            if key != keep:
+                self.discard(key)
+
+    def _forget(self, entry):
+        if entry.after_id is not None:
+            try:
+                self.root.after_cancel(entry.after_id)
+            except Exception:
+                pass
+            entry.after_id = None
+        if entry.memory is not None:
+            entry.memory.release()
+            entry.memory = None